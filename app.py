@@ -14,9 +14,12 @@ Streamlit 메인 앱
 - 향상된 UI/UX
 """
 
+import math
+import os
+import threading
+from functools import lru_cache
+
 import streamlit as st
-import numpy as np
-import pandas as pd
 from thermodynamics import (
     generate_isothermal_path,
     generate_isobaric_path,
@@ -31,507 +34,260 @@ from thermodynamics import (
     GAS_TYPES,
     R, n
 )
-from pathfinding import find_optimal_path, compare_algorithms
 from visualization import (
-    plot_pv_diagram,
-    plot_work_comparison,
-    plot_efficiency_comparison,
+    plot_pv_diagram_plotly,
+    plot_work_comparison_plotly,
+    plot_efficiency_comparison_plotly,
     plot_3d_pvt_diagram,
     plot_cycle_diagram,
     plot_thermodynamic_properties,
-    plot_algorithm_comparison,
-    create_export_data
-)
-
-# 페이지 설정
-st.set_page_config(
-    page_title="열역학 경로 최적화 시뮬레이터",
-    page_icon="⚛️",
-    layout="wide",
-    initial_sidebar_state="expanded"
+    create_export_data,
+    EXPORT_FIELDS
 )
 
-# 커스텀 CSS (향상된 UI/UX v3.0)
-st.markdown("""
-<style>
-    /* 한글 폰트 임포트 */
-    @import url('https://fonts.googleapis.com/css2?family=Noto+Sans+KR:wght@300;400;500;700;900&display=swap');
-    @import url('https://fonts.googleapis.com/css2?family=Orbitron:wght@400;700;900&display=swap');
-
-    /* 전역 폰트 설정 */
-    html, body, [class*="css"] {
-        font-family: 'Noto Sans KR', -apple-system, BlinkMacSystemFont, sans-serif !important;
-    }
-
-    /* 메인 헤더 - 네온 글로우 효과 */
-    .main-header {
-        font-size: 3rem;
-        font-weight: 900;
-        background: linear-gradient(90deg, #00d4ff, #7c3aed, #f472b6, #00d4ff);
-        background-size: 400% 400%;
-        -webkit-background-clip: text;
-        -webkit-text-fill-color: transparent;
-        background-clip: text;
-        text-align: center;
-        padding: 2rem 0 1rem 0;
-        animation: neonGlow 8s ease infinite;
-        letter-spacing: 2px;
-        filter: drop-shadow(0 0 20px rgba(0, 212, 255, 0.5));
-    }
-
-    @keyframes neonGlow {
-        0%, 100% { background-position: 0% 50%; filter: drop-shadow(0 0 20px rgba(0, 212, 255, 0.5)); }
-        25% { background-position: 50% 50%; filter: drop-shadow(0 0 25px rgba(124, 58, 237, 0.5)); }
-        50% { background-position: 100% 50%; filter: drop-shadow(0 0 30px rgba(244, 114, 182, 0.5)); }
-        75% { background-position: 50% 50%; filter: drop-shadow(0 0 25px rgba(124, 58, 237, 0.5)); }
-    }
-
-    /* 서브헤더 스타일 */
-    .sub-header {
-        font-size: 1.2rem;
-        color: #a0aec0;
-        text-align: center;
-        margin-bottom: 2rem;
-        font-weight: 400;
-        letter-spacing: 1px;
-    }
-
-    /* 글래스모피즘 카드 */
-    .glow-card {
-        background: rgba(30, 41, 59, 0.6);
-        border: 1px solid rgba(100, 200, 255, 0.2);
-        border-radius: 24px;
-        padding: 1.8rem;
-        margin: 1.5rem 0;
-        backdrop-filter: blur(20px);
-        box-shadow:
-            0 8px 32px rgba(0, 0, 0, 0.3),
-            inset 0 1px 0 rgba(255, 255, 255, 0.1);
-        transition: all 0.4s cubic-bezier(0.175, 0.885, 0.32, 1.275);
-        position: relative;
-        overflow: hidden;
-    }
-
-    .glow-card::before {
-        content: '';
-        position: absolute;
-        top: 0;
-        left: -100%;
-        width: 100%;
-        height: 100%;
-        background: linear-gradient(90deg, transparent, rgba(255, 255, 255, 0.1), transparent);
-        transition: left 0.5s;
-    }
-
-    .glow-card:hover::before {
-        left: 100%;
-    }
-
-    .glow-card:hover {
-        transform: translateY(-8px) scale(1.01);
-        box-shadow:
-            0 20px 60px rgba(0, 212, 255, 0.2),
-            0 0 40px rgba(124, 58, 237, 0.1),
-            inset 0 1px 0 rgba(255, 255, 255, 0.2);
-        border-color: rgba(0, 212, 255, 0.4);
-    }
-
-    /* 물리량 그리드 */
-    .physics-grid {
-        display: grid;
-        grid-template-columns: repeat(3, 1fr);
-        gap: 15px;
-    }
-
-    .physics-item {
-        text-align: center;
-        padding: 12px;
-        border-radius: 12px;
-        background: rgba(255, 255, 255, 0.03);
-        transition: all 0.3s ease;
-    }
-
-    .physics-item:hover {
-        background: rgba(255, 255, 255, 0.08);
-        transform: scale(1.05);
-    }
-
-    .physics-symbol {
-        font-size: 1.5rem;
-        font-weight: 700;
-        display: block;
-        margin-bottom: 4px;
-    }
-
-    .physics-name {
-        font-size: 0.85rem;
-        color: #a0aec0;
-    }
-
-    /* 탭 스타일 - 사이버펑크 */
-    .stTabs [data-baseweb="tab-list"] {
-        gap: 8px;
-        background: rgba(15, 23, 42, 0.8);
-        padding: 10px;
-        border-radius: 20px;
-        border: 1px solid rgba(100, 200, 255, 0.1);
-    }
-
-    .stTabs [data-baseweb="tab"] {
-        padding: 14px 28px;
-        border-radius: 14px;
-        font-weight: 600;
-        transition: all 0.3s ease;
-        color: #94a3b8;
-        background: transparent;
-    }
-
-    .stTabs [data-baseweb="tab"]:hover {
-        background: rgba(0, 212, 255, 0.1);
-        color: #00d4ff;
-    }
-
-    .stTabs [aria-selected="true"] {
-        background: linear-gradient(135deg, #0ea5e9, #7c3aed) !important;
-        color: white !important;
-        box-shadow: 0 4px 20px rgba(0, 212, 255, 0.4);
-    }
-
-    /* 버튼 스타일 - 홀로그램 효과 */
-    .stButton > button {
-        border-radius: 14px;
-        font-weight: 600;
-        transition: all 0.3s cubic-bezier(0.175, 0.885, 0.32, 1.275);
-        border: 1px solid rgba(100, 200, 255, 0.2);
-        background: rgba(30, 41, 59, 0.8);
-        color: #e2e8f0;
-        position: relative;
-        overflow: hidden;
-    }
-
-    .stButton > button::before {
-        content: '';
-        position: absolute;
-        top: 0;
-        left: -100%;
-        width: 100%;
-        height: 100%;
-        background: linear-gradient(90deg, transparent, rgba(255, 255, 255, 0.2), transparent);
-        transition: left 0.4s;
-    }
 
-    .stButton > button:hover::before {
-        left: 100%;
-    }
+# ==================== 캐시된 계산 함수 ====================
+# Streamlit은 위젯 조작마다 스크립트 전체를 다시 실행하므로
+# 같은 입력에 대한 수치 계산은 캐시에서 재사용한다.
+
+def _generate_path(path_type, P1, V1, P2, V2, gas_type):
+    """경로 타입에 맞는 P, V 배열 생성"""
+    if path_type == "등온":
+        return generate_isothermal_path(P1, V1, P2, V2)
+    elif path_type == "등압":
+        return generate_isobaric_path(P1, V1, V2)
+    elif path_type == "등적":
+        return generate_isochoric_path(V1, P1, P2)
+    elif path_type == "단열":
+        return generate_adiabatic_path(P1, V1, P2, V2, gas_type=gas_type)
+    raise ValueError(f"알 수 없는 경로 타입: {path_type}")
+
+
+@st.cache_data(max_entries=128, show_spinner=False)
+def _build_path(path_type, P1, V1, P2, V2, gas_type):
+    """경로 생성 + 열역학적 성질 계산 (스칼라 인자만으로 캐시되어 배열 해시가 필요 없음)"""
+    P_array, V_array = _generate_path(path_type, P1, V1, P2, V2, gas_type)
+    return calculate_path_properties(P_array, V_array, path_type, gas_type)
+
+
+_CYCLE_GENERATORS = {
+    'otto': generate_otto_cycle,
+    'diesel': generate_diesel_cycle,
+    'brayton': generate_brayton_cycle,
+    'carnot': generate_carnot_cycle,
+}
+
+
+@st.cache_data(max_entries=32, show_spinner=False)
+def _build_cycle(cycle_name, **params):
+    """사이클 생성 (스칼라 인자만으로 캐시)"""
+    return _CYCLE_GENERATORS[cycle_name](**params)
+
+
+def _generate_cycle(cycle_name, **params):
+    """사이클을 만들어 세션에 저장. 그래프 캐시 키도 인자로 함께 기록한다."""
+    cycle = _build_cycle(cycle_name, **params)
+    st.session_state.cycle_data = cycle
+    st.session_state.cycle_key = (cycle_name, tuple(sorted(params.items())))
+    return cycle
+
+
+@st.cache_data(max_entries=64)
+def _find_optimal_path(P1, V1, P2, V2, grid_size, algorithm, optimization_target, gas_type):
+    """최적 경로 탐색"""
+    # pathfinding은 numba 커널 때문에 import가 무거워 버튼을 눌렀을 때 불러온다
+    from pathfinding import find_optimal_path
+    return find_optimal_path(
+        P1, V1, P2, V2,
+        grid_size=grid_size,
+        algorithm=algorithm,
+        optimization_target=optimization_target,
+        gas_type=gas_type
+    )
 
-    .stButton > button:hover {
-        transform: translateY(-3px);
-        box-shadow: 0 10px 30px rgba(0, 212, 255, 0.3);
-        border-color: rgba(0, 212, 255, 0.5);
-        color: #00d4ff;
-    }
 
-    .stButton > button[kind="primary"] {
-        background: linear-gradient(135deg, #0ea5e9, #7c3aed);
-        border: none;
-        color: white;
-    }
+def _compare_algorithms(P1, V1, P2, V2, grid_size, gas_type):
+    """
+    Dijkstra와 A* 알고리즘 비교
+    실행 시간을 보여주는 기능이므로 결과를 캐시하지 않고 매번 새로 측정한다.
+    (격자 그래프는 pathfinding 안에서 재사용되어 반복 실행도 탐색 시간만 든다)
+    """
+    from pathfinding import compare_algorithms
+    return compare_algorithms(P1, V1, P2, V2, grid_size=grid_size, gas_type=gas_type)
 
-    .stButton > button[kind="primary"]:hover {
-        background: linear-gradient(135deg, #7c3aed, #0ea5e9);
-        box-shadow: 0 10px 40px rgba(124, 58, 237, 0.5);
-    }
 
-    /* 사이드바 스타일 - 다크 테마 */
-    [data-testid="stSidebar"] {
-        background: linear-gradient(180deg, rgba(15, 23, 42, 0.95), rgba(30, 41, 59, 0.95));
-        border-right: 1px solid rgba(100, 200, 255, 0.1);
-    }
+@st.cache_resource(show_spinner=False)
+def _warm_up_pathfinding():
+    """
+    numba 탐색 커널(import + 캐시된 기계어 로드)을 서버당 한 번 백그라운드에서 미리 불러온다.
+    첫 화면은 기다리지 않고, 첫 '최적 경로 찾기' 클릭의 지연만 없앤다.
+    """
+    def warm_up():
+        from pathfinding import find_optimal_path
+        for algorithm in ('dijkstra', 'astar'):
+            find_optimal_path(5.0, 2.0, 1.0, 8.0, grid_size=5, algorithm=algorithm)
 
-    /* 사이드바 모든 텍스트 밝게 */
-    [data-testid="stSidebar"],
-    [data-testid="stSidebar"] * {
-        color: #e2e8f0 !important;
-    }
+    thread = threading.Thread(target=warm_up, name="pathfinding-warmup", daemon=True)
+    thread.start()
+    return thread
 
-    [data-testid="stSidebar"] .stSelectbox label,
-    [data-testid="stSidebar"] .stSlider label,
-    [data-testid="stSidebar"] .stMarkdown,
-    [data-testid="stSidebar"] p,
-    [data-testid="stSidebar"] span,
-    [data-testid="stSidebar"] h1,
-    [data-testid="stSidebar"] h2,
-    [data-testid="stSidebar"] h3,
-    [data-testid="stSidebar"] h4 {
-        font-weight: 600;
-        color: #e2e8f0 !important;
-    }
 
-    [data-testid="stSidebar"] .stSelectbox > div > div,
-    [data-testid="stSidebar"] input {
-        color: #e2e8f0 !important;
-        background-color: rgba(30, 41, 59, 0.8) !important;
-    }
+# 스칼라 계산은 st.cache_data의 해시 비용보다 싸므로 lru_cache 사용
+@lru_cache(maxsize=256)
+def _temperature(P, V):
+    """상태점 온도 T = PV/(nR)"""
+    return calculate_temperature(P, V)
 
-    /* 익스팬더 스타일 */
-    .streamlit-expanderHeader {
-        font-weight: 700;
-        border-radius: 14px;
-        transition: all 0.3s ease;
-        background: rgba(30, 41, 59, 0.6);
-        border: 1px solid rgba(100, 200, 255, 0.1);
-    }
 
-    .streamlit-expanderHeader:hover {
-        background: rgba(0, 212, 255, 0.1);
-        border-color: rgba(0, 212, 255, 0.3);
-    }
+@lru_cache(maxsize=256)
+def _reversible_work(P1, V1, V2):
+    """등온 가역 과정의 일: W_rev = nRT₁ ln(V2/V1) (부피가 0 이하이면 None)"""
+    if V1 <= 0 or V2 <= 0:
+        return None
+    return n * R * _temperature(P1, V1) * math.log(V2 / V1)
 
-    /* 데이터프레임 스타일 */
-    .stDataFrame {
-        border-radius: 16px;
-        overflow: hidden;
-        border: 1px solid rgba(100, 200, 255, 0.1);
-    }
 
-    /* 메트릭 위젯 스타일 - 네온 카드 */
-    [data-testid="stMetric"] {
-        background: linear-gradient(135deg, rgba(15, 23, 42, 0.9), rgba(30, 41, 59, 0.9));
-        padding: 1.2rem;
-        border-radius: 16px;
-        border: 1px solid rgba(100, 200, 255, 0.15);
-        box-shadow: 0 4px 20px rgba(0, 0, 0, 0.3);
-        transition: all 0.3s ease;
-    }
+def _export_key(path):
+    """CSV에 쓰이는 스칼라만 모은 캐시 키 (배열 해시 생략)"""
+    if not path:
+        return None
+    return (path.get('type'),) + tuple(path.get(k, 0) for k in EXPORT_FIELDS)
 
-    [data-testid="stMetric"]:hover {
-        border-color: rgba(0, 212, 255, 0.4);
-        box-shadow: 0 8px 30px rgba(0, 212, 255, 0.2);
-    }
 
-    [data-testid="stMetricValue"] {
-        font-weight: 800;
-        font-size: 1.8rem;
-        background: linear-gradient(135deg, #00d4ff, #7c3aed);
-        -webkit-background-clip: text;
-        -webkit-text-fill-color: transparent;
-    }
+@st.cache_data(max_entries=32)
+def _export_csv(paths_key, optimal_key, _paths, _optimal_path):
+    """CSV 바이트 캐시 (밑줄로 시작하는 인자는 Streamlit이 해시하지 않음)"""
+    return create_export_data(_paths, _optimal_path).encode('utf-8')
 
-    [data-testid="stMetricLabel"] {
-        color: #94a3b8;
-        font-weight: 500;
-    }
 
-    /* 성공/에러/정보 메시지 스타일 */
-    .stSuccess {
-        border-radius: 14px;
-        padding: 1rem;
-        background: rgba(16, 185, 129, 0.1);
-        border: 1px solid rgba(16, 185, 129, 0.3);
-    }
+# ==================== 표 출력 ====================
 
-    .stError {
-        border-radius: 14px;
-        padding: 1rem;
-        background: rgba(239, 68, 68, 0.1);
-        border: 1px solid rgba(239, 68, 68, 0.3);
-    }
+def _markdown_table(columns):
+    """{열 이름: 값 목록} 딕셔너리를 마크다운 표 문자열로 변환 (작은 표에 DataFrame 생성 비용을 쓰지 않음)"""
+    header = "| " + " | ".join(columns) + " |"
+    divider = "|" + "---|" * len(columns)
+    rows = ["| " + " | ".join(str(v) for v in row) + " |" for row in zip(*columns.values())]
+    return "\n".join([header, divider] + rows)
 
-    .stInfo {
-        border-radius: 14px;
-        padding: 1rem;
-        background: rgba(59, 130, 246, 0.1);
-        border: 1px solid rgba(59, 130, 246, 0.3);
-    }
 
-    .stWarning {
-        border-radius: 14px;
-        padding: 1rem;
-        background: rgba(245, 158, 11, 0.1);
-        border: 1px solid rgba(245, 158, 11, 0.3);
-    }
+def _metric_grid(items, columns):
+    """(이름, 값, 색) 목록을 물리량 카드 그리드 HTML 하나로 변환 (st.metric 여러 개 대신)"""
+    cells = "".join(
+        f'<div class="physics-item"><span class="physics-symbol" style="color: {color};">{value}</span>'
+        f'<span class="physics-name">{label}</span></div>'
+        for label, value, color in items
+    )
+    return f'<div class="physics-grid" style="grid-template-columns: repeat({columns}, 1fr);">{cells}</div>'
 
-    /* 스크롤바 스타일 - 네온 */
-    ::-webkit-scrollbar {
-        width: 10px;
-        height: 10px;
-    }
 
-    ::-webkit-scrollbar-track {
-        background: rgba(15, 23, 42, 0.8);
-        border-radius: 10px;
-    }
+@st.cache_data(max_entries=32)
+def _cycle_summary(cycle_key, _cycle_data):
+    """사이클 성능 카드 HTML과 상태점 표 (사이클이 새로 생성될 때만 다시 만든다)"""
+    metrics = _metric_grid([
+        ("효율", f"{_cycle_data['efficiency']:.1f}%", "#4ade80"),
+        ("순일 (L·atm)", f"{_cycle_data['W_net']:.2f}", "#00d4ff"),
+        ("흡수 열 (L·atm)", f"{_cycle_data['Q_in']:.2f}", "#7c3aed"),
+        ("방출 열 (L·atm)", f"{_cycle_data['Q_out']:.2f}", "#fb923c"),
+    ], columns=4)
+    states = _cycle_data['states']
+    table = _markdown_table({
+        "상태": states['names'],
+        "P (atm)": [f"{P:.2f}" for P in states['P']],
+        "V (L)": [f"{V:.2f}" for V in states['V']],
+        "T (K)": [f"{T:.1f}" for T in states['T']],
+    })
+    return metrics, table
 
-    ::-webkit-scrollbar-thumb {
-        background: linear-gradient(135deg, #0ea5e9, #7c3aed);
-        border-radius: 10px;
-        border: 2px solid rgba(15, 23, 42, 0.8);
-    }
 
-    ::-webkit-scrollbar-thumb:hover {
-        background: linear-gradient(135deg, #7c3aed, #0ea5e9);
-    }
+# ==================== 캐시된 그래프 ====================
+# 입력(경로, 상태점, 테마)이 바뀌지 않은 재실행에서는 그래프를 다시 그리지 않는다.
+# Plotly Figure는 복사본을 돌려받으므로 호출 쪽에서 수정해도 안전하다.
 
-    /* 입력 필드 스타일 */
-    .stSelectbox > div > div,
-    .stSlider > div > div {
-        border-radius: 12px;
-    }
+def _path_key(path):
+    """
+    그래프 캐시용 경로 식별 튜플.
+    경로 배열은 타입·기체·양 끝점으로 결정되므로 배열 전체 대신 이 값들로 해시한다.
+    (같은 격자 경로라도 원래 상태점에 따라 달라지는 W, Q, 효율도 포함)
+    """
+    if not path:
+        return None
+    P, V = path['P_array'], path['V_array']
+    return (path.get('type'), path.get('gas_type'), path.get('optimization_target'),
+            len(P), P[0], V[0], P[-1], V[-1],
+            path.get('W'), path.get('Q'), path.get('efficiency'))
 
-    /* 동적 배경 */
-    .cyber-bg {
-        position: fixed;
-        top: 0;
-        left: 0;
-        width: 100%;
-        height: 100%;
-        pointer-events: none;
-        z-index: -1;
-        background:
-            radial-gradient(ellipse at 20% 80%, rgba(0, 212, 255, 0.08) 0%, transparent 50%),
-            radial-gradient(ellipse at 80% 20%, rgba(124, 58, 237, 0.08) 0%, transparent 50%),
-            radial-gradient(ellipse at 50% 50%, rgba(244, 114, 182, 0.03) 0%, transparent 70%);
-    }
 
-    /* 그리드 오버레이 */
-    .grid-overlay {
-        position: fixed;
-        top: 0;
-        left: 0;
-        width: 100%;
-        height: 100%;
-        pointer-events: none;
-        z-index: -1;
-        background-image:
-            linear-gradient(rgba(0, 212, 255, 0.03) 1px, transparent 1px),
-            linear-gradient(90deg, rgba(0, 212, 255, 0.03) 1px, transparent 1px);
-        background-size: 50px 50px;
-    }
+def _graph_keys():
+    """현재 경로 목록과 최적 경로의 캐시 키"""
+    return (tuple(st.session_state.path_keys),
+            _path_key(st.session_state.optimal_path))
 
-    /* 푸터 스타일 - 퓨처리스틱 */
-    .footer {
-        text-align: center;
-        padding: 3rem 0;
-        margin-top: 4rem;
-        background: linear-gradient(180deg, transparent, rgba(15, 23, 42, 0.8));
-        border-top: 1px solid rgba(100, 200, 255, 0.1);
-    }
 
-    .footer-title {
-        font-size: 1.3rem;
-        font-weight: 800;
-        background: linear-gradient(90deg, #00d4ff, #7c3aed, #f472b6);
-        -webkit-background-clip: text;
-        -webkit-text-fill-color: transparent;
-        margin-bottom: 0.5rem;
-    }
+# 밑줄로 시작하는 인자(_paths, _optimal_path)는 해시하지 않고 앞의 키로 캐시를 찾는다.
+@st.cache_data(max_entries=32)
+def _pv_diagram_figure(paths_key, optimal_key, P1, V1, P2, V2, dark_mode, _paths, _optimal_path):
+    return plot_pv_diagram_plotly(_paths, _optimal_path, P1, V1, P2, V2, dark_mode=dark_mode)
 
-    .footer-subtitle {
-        color: #64748b;
-        font-size: 0.95rem;
-        margin-bottom: 1rem;
-    }
 
-    .footer-tech {
-        color: #475569;
-        font-size: 0.8rem;
-    }
+@st.cache_data(max_entries=32)
+def _work_comparison_figure(paths_key, optimal_key, W_reversible, dark_mode, _paths, _optimal_path):
+    return plot_work_comparison_plotly(_paths, _optimal_path, W_reversible, dark_mode=dark_mode)
 
-    /* 펄스 애니메이션 */
-    @keyframes pulse {
-        0%, 100% { box-shadow: 0 0 0 0 rgba(0, 212, 255, 0.4); }
-        50% { box-shadow: 0 0 0 15px rgba(0, 212, 255, 0); }
-    }
 
-    .pulse {
-        animation: pulse 2s cubic-bezier(0.4, 0, 0.6, 1) infinite;
-    }
+@st.cache_data(max_entries=32)
+def _efficiency_comparison_figure(paths_key, optimal_key, dark_mode, _paths, _optimal_path):
+    return plot_efficiency_comparison_plotly(_paths, _optimal_path, dark_mode=dark_mode)
 
-    /* 페이드인 애니메이션 */
-    @keyframes fadeInUp {
-        from { opacity: 0; transform: translateY(30px); }
-        to { opacity: 1; transform: translateY(0); }
-    }
 
-    .fade-in {
-        animation: fadeInUp 0.8s cubic-bezier(0.16, 1, 0.3, 1);
-    }
+@st.cache_data(max_entries=32)
+def _properties_figure(paths_key, optimal_key, dark_mode, _paths, _optimal_path):
+    return plot_thermodynamic_properties(_paths, _optimal_path, dark_mode=dark_mode)
 
-    /* 플로팅 애니메이션 */
-    @keyframes float {
-        0%, 100% { transform: translateY(0px); }
-        50% { transform: translateY(-10px); }
-    }
 
-    .floating {
-        animation: float 3s ease-in-out infinite;
-    }
+@st.cache_data(max_entries=32)
+def _pvt_3d_figure(paths_key, optimal_key, P1, V1, P2, V2, dark_mode, _paths, _optimal_path):
+    # 표면은 항상 포함해 캐시하고, 표시 여부는 받은 복사본에서 토글한다
+    return plot_3d_pvt_diagram(_paths, _optimal_path, P1, V1, P2, V2,
+                               show_surface=True, dark_mode=dark_mode)
 
-    /* 상태 배지 스타일 */
-    .status-badge {
-        display: inline-block;
-        padding: 6px 16px;
-        border-radius: 30px;
-        font-size: 0.85rem;
-        font-weight: 700;
-        margin: 5px;
-        transition: all 0.3s ease;
-    }
 
-    .status-badge.active {
-        background: linear-gradient(135deg, #10b981, #059669);
-        color: white;
-        box-shadow: 0 4px 15px rgba(16, 185, 129, 0.4);
-    }
+@st.cache_data(max_entries=32)
+def _cycle_figure(cycle_key, dark_mode, _cycle_data):
+    # 사이클 배열 대신 생성 인자(cycle_key)로 캐시를 찾는다
+    return plot_cycle_diagram(_cycle_data, dark_mode)
 
-    .status-badge.active:hover {
-        transform: translateY(-2px);
-        box-shadow: 0 6px 20px rgba(16, 185, 129, 0.5);
-    }
 
-    .status-badge.inactive {
-        background: rgba(100, 116, 139, 0.2);
-        color: #64748b;
-    }
+# 페이지 설정
+st.set_page_config(
+    page_title="열역학 경로 최적화 시뮬레이터",
+    page_icon="⚛️",
+    layout="wide",
+    initial_sidebar_state="expanded"
+)
 
-    /* 섹션 타이틀 */
-    .section-title {
-        font-size: 1.5rem;
-        font-weight: 700;
-        color: #e2e8f0;
-        margin-bottom: 1rem;
-        display: flex;
-        align-items: center;
-        gap: 10px;
-    }
+# 커스텀 CSS (assets/style.css)
+@st.cache_resource
+def _custom_css():
+    """스타일시트를 한 번만 읽어 <style> 블록으로 감싼다"""
+    css_path = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'assets', 'style.css')
+    with open(css_path, encoding='utf-8') as f:
+        return f"<style>{f.read()}</style>"
 
-    .section-title::before {
-        content: '';
-        width: 4px;
-        height: 24px;
-        background: linear-gradient(180deg, #00d4ff, #7c3aed);
-        border-radius: 2px;
-    }
 
-    /* 반짝임 효과 */
-    @keyframes shimmer {
-        0% { background-position: -200% 0; }
-        100% { background-position: 200% 0; }
-    }
+# <style>만 담긴 st.html은 레이아웃 공간 없이 주입되고, 마크다운 파싱을 거치지 않는다.
+# (스타일은 재실행마다 다시 보내야 유지된다. 탭 fragment 재실행에서는 다시 보내지 않음)
+st.html(_custom_css())
+st.markdown('<div class="cyber-bg"></div>\n<div class="grid-overlay"></div>', unsafe_allow_html=True)
 
-    .shimmer {
-        background: linear-gradient(90deg, transparent, rgba(255, 255, 255, 0.1), transparent);
-        background-size: 200% 100%;
-        animation: shimmer 2s infinite;
-    }
-</style>
-<div class="cyber-bg"></div>
-<div class="grid-overlay"></div>
-""", unsafe_allow_html=True)
+_warm_up_pathfinding()
 
 # 세션 상태 초기화
 if 'paths' not in st.session_state:
     st.session_state.paths = []
+# 경로별 캐시 키는 경로 목록과 나란한 열로 보관해 재실행마다 다시 만들지 않는다
+if 'path_keys' not in st.session_state:
+    st.session_state.path_keys = []
+    st.session_state.path_export_keys = []
 if 'optimal_path' not in st.session_state:
     st.session_state.optimal_path = None
 if 'P1' not in st.session_state:
@@ -548,6 +304,12 @@ if 'dark_mode' not in st.session_state:
     st.session_state.dark_mode = True
 if 'cycle_data' not in st.session_state:
     st.session_state.cycle_data = None
+if 'cycle_key' not in st.session_state:
+    st.session_state.cycle_key = None
+# 상태 설정 폼의 슬라이더 값 ('적용'을 눌러야 P1~V2에 반영됨)
+for _key in ('P1', 'V1', 'P2', 'V2'):
+    if f'{_key}_slider' not in st.session_state:
+        st.session_state[f'{_key}_slider'] = st.session_state[_key]
 # 앱 최초 실행 시 예시 경로 자동 추가
 if 'initialized' not in st.session_state:
     st.session_state.initialized = True
@@ -596,6 +358,49 @@ st.markdown("""
 """, unsafe_allow_html=True)
 
 # 사이드바
+# 삭제/초기화는 콜백으로 처리: 스크립트 실행 전에 상태가 바뀌므로
+# 슬라이더와 탭이 같은 실행에서 새 값을 그린다 (st.rerun 불필요).
+def _clear_paths():
+    st.session_state.paths = []
+    st.session_state.path_keys = []
+    st.session_state.path_export_keys = []
+    st.session_state.optimal_path = None
+    st.session_state.cycle_data = None
+    st.session_state.cycle_key = None
+
+
+def _reset_state():
+    _clear_paths()
+    st.session_state.P1 = 5.0
+    st.session_state.V1 = 2.0
+    st.session_state.P2 = 1.0
+    st.session_state.V2 = 8.0
+    for key in ('P1', 'V1', 'P2', 'V2'):
+        st.session_state[f'{key}_slider'] = st.session_state[key]
+
+
+def _add_path():
+    """경로 추가 콜백: 스크립트 실행 전에 목록에 넣으므로 탭이 같은 실행에서 새 경로를 그린다"""
+    path_type = st.session_state.path_type
+    P1, V1 = st.session_state.P1, st.session_state.V1
+    P2, V2 = st.session_state.P2, st.session_state.V2
+
+    try:
+        path = _build_path(path_type, P1, V1, P2, V2, st.session_state.gas_type)
+        st.session_state.paths.append(path)
+        st.session_state.path_keys.append(_path_key(path))
+        st.session_state.path_export_keys.append(_export_key(path))
+        st.session_state.path_message = f"✅ {path_type} 경로 추가됨!"
+    except Exception as e:
+        st.session_state.path_error = f"오류: {e}"
+
+
+# 경로 타입 선택만 fragment로 두어 선택을 바꿀 때는 사이드바 안에서만 다시 실행
+@st.fragment
+def _path_type_select():
+    st.selectbox("경로 타입", ["등온", "등압", "등적", "단열"], key="path_type")
+
+
 with st.sidebar:
     st.title("⚙️ 설정")
 
@@ -625,19 +430,25 @@ with st.sidebar:
     # 상태 설정
     st.subheader("📊 상태 설정")
 
-    col_a, col_b = st.columns(2)
-    with col_a:
-        st.markdown("**초기 상태 A**")
-        st.session_state.P1 = st.slider("P₁ (atm)", 1.0, 10.0, st.session_state.P1, 0.1)
-        st.session_state.V1 = st.slider("V₁ (L)", 1.0, 10.0, st.session_state.V1, 0.1)
+    # 폼으로 묶어 슬라이더를 끄는 동안에는 재실행하지 않고, '적용' 시 한 번만 반영
+    with st.form("state_form", border=False):
+        col_a, col_b = st.columns(2)
+        with col_a:
+            st.markdown("**초기 상태 A**")
+            st.slider("P₁ (atm)", 1.0, 10.0, step=0.1, key="P1_slider")
+            st.slider("V₁ (L)", 1.0, 10.0, step=0.1, key="V1_slider")
+
+        with col_b:
+            st.markdown("**최종 상태 B**")
+            st.slider("P₂ (atm)", 1.0, 10.0, step=0.1, key="P2_slider")
+            st.slider("V₂ (L)", 1.0, 10.0, step=0.1, key="V2_slider")
 
-    with col_b:
-        st.markdown("**최종 상태 B**")
-        st.session_state.P2 = st.slider("P₂ (atm)", 1.0, 10.0, st.session_state.P2, 0.1)
-        st.session_state.V2 = st.slider("V₂ (L)", 1.0, 10.0, st.session_state.V2, 0.1)
+        if st.form_submit_button("✅ 적용", use_container_width=True):
+            for key in ('P1', 'V1', 'P2', 'V2'):
+                st.session_state[key] = st.session_state[f'{key}_slider']
 
-    T1 = calculate_temperature(st.session_state.P1, st.session_state.V1)
-    T2 = calculate_temperature(st.session_state.P2, st.session_state.V2)
+    T1 = _temperature(st.session_state.P1, st.session_state.V1)
+    T2 = _temperature(st.session_state.P2, st.session_state.V2)
 
     st.success(f"**T₁ = {T1:.1f} K** → **T₂ = {T2:.1f} K**")
 
@@ -646,28 +457,13 @@ with st.sidebar:
     # 경로 추가
     st.subheader("🛤️ 경로 추가")
 
-    path_type = st.selectbox("경로 타입", ["등온", "등압", "등적", "단열"])
-
-    if st.button("➕ 경로 추가", use_container_width=True):
-        P1, V1 = st.session_state.P1, st.session_state.V1
-        P2, V2 = st.session_state.P2, st.session_state.V2
-
-        try:
-            if path_type == "등온":
-                P_array, V_array = generate_isothermal_path(P1, V1, P2, V2)
-            elif path_type == "등압":
-                P_array, V_array = generate_isobaric_path(P1, V1, V2)
-            elif path_type == "등적":
-                P_array, V_array = generate_isochoric_path(V1, P1, P2)
-            elif path_type == "단열":
-                P_array, V_array = generate_adiabatic_path(P1, V1, P2, V2, gas_type=st.session_state.gas_type)
-
-            path = calculate_path_properties(P_array, V_array, path_type, st.session_state.gas_type)
-            st.session_state.paths.append(path)
-            st.success(f"✅ {path_type} 경로 추가됨!")
-            st.rerun()
-        except Exception as e:
-            st.error(f"오류: {e}")
+    _path_type_select()
+    st.button("➕ 경로 추가", use_container_width=True, on_click=_add_path)
+
+    if 'path_error' in st.session_state:
+        st.error(st.session_state.pop('path_error'))
+    if 'path_message' in st.session_state:
+        st.toast(st.session_state.pop('path_message'))
 
     st.divider()
 
@@ -676,27 +472,57 @@ with st.sidebar:
 
     col1, col2 = st.columns(2)
     with col1:
-        if st.button("🗑️ 경로 삭제", use_container_width=True):
-            st.session_state.paths = []
-            st.session_state.optimal_path = None
-            st.session_state.cycle_data = None
-            st.rerun()
+        st.button("🗑️ 경로 삭제", use_container_width=True, on_click=_clear_paths)
     with col2:
-        if st.button("🔄 초기화", use_container_width=True):
-            st.session_state.paths = []
-            st.session_state.optimal_path = None
-            st.session_state.cycle_data = None
-            st.session_state.P1 = 5.0
-            st.session_state.V1 = 2.0
-            st.session_state.P2 = 1.0
-            st.session_state.V2 = 8.0
-            st.rerun()
+        st.button("🔄 초기화", use_container_width=True, on_click=_reset_state)
 
 # 메인 탭
+# 각 탭은 fragment로 렌더링: 탭 안의 위젯 조작은 그 탭만 다시 실행한다.
+# 사이드바(초기/최종 상태, 경로 목록)가 바뀌면 앱 전체가 다시 실행된다.
 tab1, tab2, tab3, tab4 = st.tabs(["📈 경로 분석", "🔄 열역학 사이클", "🔬 3D 시각화", "📊 알고리즘 비교"])
 
+# 최적 경로 탐색 컨트롤 (탭 1 안의 fragment)
+@st.fragment
+def _optimal_path_controls():
+    col_btn1, col_btn2, col_btn3 = st.columns(3)
+
+    with col_btn1:
+        algorithm = st.selectbox("알고리즘", ["dijkstra", "astar"], format_func=lambda x: "Dijkstra" if x == "dijkstra" else "A*",
+                                help="Dijkstra: 정확한 최단 경로 탐색\nA*: 휴리스틱을 사용한 빠른 탐색")
+
+    with col_btn2:
+        optimization = st.selectbox("최적화 목표", ["max_work", "min_entropy", "max_efficiency"],
+                                    format_func=lambda x: {"max_work": "최대 일", "min_entropy": "최소 엔트로피", "max_efficiency": "최대 효율"}[x],
+                                    help="최대 일: 가장 많은 일을 하는 경로\n최소 엔트로피: 엔트로피 증가가 가장 적은 경로\n최대 효율: 효율이 가장 높은 경로")
+
+    with col_btn3:
+        if st.button("🔍 최적 경로 찾기", use_container_width=True, type="primary"):
+            with st.spinner("최적 경로 탐색 중..."):
+                try:
+                    optimal = _find_optimal_path(
+                        st.session_state.P1, st.session_state.V1,
+                        st.session_state.P2, st.session_state.V2,
+                        grid_size=50,
+                        algorithm=algorithm,
+                        optimization_target=optimization,
+                        gas_type=st.session_state.gas_type
+                    )
+                    if optimal:
+                        st.session_state.optimal_path = optimal
+                        # 최적 경로는 3D 탭에서도 쓰이므로 앱 전체를 다시 실행
+                        st.session_state.optimal_message = f"✅ 최적 경로 발견! W = {optimal['W']:.2f} L·atm"
+                        st.rerun()
+                    else:
+                        st.error("최적 경로를 찾을 수 없습니다.")
+                except Exception as e:
+                    st.error(f"오류: {e}")
+        if 'optimal_message' in st.session_state:
+            st.success(st.session_state.pop('optimal_message'))
+
+
 # 탭 1: 경로 분석
-with tab1:
+@st.fragment
+def _render_path_analysis_tab():
     # 상단 설명 카드
     st.markdown("""
     <div class="glow-card fade-in">
@@ -719,37 +545,8 @@ with tab1:
     col_main1, col_main2 = st.columns([2, 1])
 
     with col_main1:
-        # 최적 경로 찾기 버튼
-        col_btn1, col_btn2, col_btn3 = st.columns(3)
-
-        with col_btn1:
-            algorithm = st.selectbox("알고리즘", ["dijkstra", "astar"], format_func=lambda x: "Dijkstra" if x == "dijkstra" else "A*",
-                                    help="Dijkstra: 정확한 최단 경로 탐색\nA*: 휴리스틱을 사용한 빠른 탐색")
-
-        with col_btn2:
-            optimization = st.selectbox("최적화 목표", ["max_work", "min_entropy", "max_efficiency"],
-                                        format_func=lambda x: {"max_work": "최대 일", "min_entropy": "최소 엔트로피", "max_efficiency": "최대 효율"}[x],
-                                        help="최대 일: 가장 많은 일을 하는 경로\n최소 엔트로피: 엔트로피 증가가 가장 적은 경로\n최대 효율: 효율이 가장 높은 경로")
-
-        with col_btn3:
-            if st.button("🔍 최적 경로 찾기", use_container_width=True, type="primary"):
-                with st.spinner("최적 경로 탐색 중..."):
-                    try:
-                        optimal = find_optimal_path(
-                            st.session_state.P1, st.session_state.V1,
-                            st.session_state.P2, st.session_state.V2,
-                            grid_size=50,
-                            algorithm=algorithm,
-                            optimization_target=optimization,
-                            gas_type=st.session_state.gas_type
-                        )
-                        if optimal:
-                            st.session_state.optimal_path = optimal
-                            st.success(f"✅ 최적 경로 발견! W = {optimal['W']:.2f} L·atm")
-                        else:
-                            st.error("최적 경로를 찾을 수 없습니다.")
-                    except Exception as e:
-                        st.error(f"오류: {e}")
+        # 최적 경로 찾기 (별도 fragment: 선택 상자를 바꿔도 그래프는 다시 그리지 않음)
+        _optimal_path_controls()
 
         # P-V 다이어그램 - 경로가 있을 때만 표시
         if st.session_state.paths or st.session_state.optimal_path:
@@ -764,14 +561,14 @@ with tab1:
             </div>
             """, unsafe_allow_html=True)
 
-            fig_pv, _ = plot_pv_diagram(
-                st.session_state.paths,
-                st.session_state.optimal_path,
+            fig_pv = _pv_diagram_figure(
+                *_graph_keys(),
                 st.session_state.P1, st.session_state.V1,
                 st.session_state.P2, st.session_state.V2,
-                dark_mode=st.session_state.dark_mode
+                st.session_state.dark_mode,
+                st.session_state.paths, st.session_state.optimal_path
             )
-            st.pyplot(fig_pv)
+            st.plotly_chart(fig_pv, use_container_width=True)
         else:
             # 경로가 없을 때 - 시작 안내
             st.markdown("""
@@ -797,26 +594,33 @@ with tab1:
 
         if st.session_state.optimal_path:
             opt = st.session_state.optimal_path
-            st.metric("⭐ 최적 경로 일", f"{opt['W']:.2f} L·atm")
-            st.metric("효율", f"{opt['efficiency']:.1f}%")
-            st.metric("엔트로피 변화", f"{opt['dS']:.4f} L·atm/K")
+            st.markdown(_metric_grid([
+                ("⭐ 최적 경로 일 (L·atm)", f"{opt['W']:.2f}", "#00d4ff"),
+                ("효율", f"{opt['efficiency']:.1f}%", "#4ade80"),
+                ("엔트로피 변화 (L·atm/K)", f"{opt['dS']:.4f}", "#f472b6"),
+            ], columns=1), unsafe_allow_html=True)
 
             # 추가 정보
             with st.expander("상세 정보"):
-                st.write(f"**열 (Q):** {opt['Q']:.2f} L·atm")
-                st.write(f"**ΔU:** {opt['dU']:.2f} L·atm")
-                st.write(f"**ΔH:** {opt.get('dH', 0):.2f} L·atm")
-                st.write(f"**ΔG:** {opt.get('dG', 0):.2f} L·atm")
-                st.write(f"**알고리즘:** {opt.get('algorithm', 'dijkstra').upper()}")
+                st.markdown("  \n".join([
+                    f"**열 (Q):** {opt['Q']:.2f} L·atm",
+                    f"**ΔU:** {opt['dU']:.2f} L·atm",
+                    f"**ΔH:** {opt.get('dH', 0):.2f} L·atm",
+                    f"**ΔG:** {opt.get('dG', 0):.2f} L·atm",
+                    f"**알고리즘:** {opt.get('algorithm', 'dijkstra').upper()}",
+                ]))
 
         # 경로 목록
         if st.session_state.paths:
             st.subheader("경로 목록")
-            for i, path in enumerate(st.session_state.paths):
-                with st.expander(f"경로 {i+1}: {path.get('type', '일반')}"):
-                    st.write(f"**W:** {path['W']:.2f} L·atm")
-                    st.write(f"**Q:** {path['Q']:.2f} L·atm")
-                    st.write(f"**효율:** {path['efficiency']:.1f}%")
+            paths = st.session_state.paths
+            st.markdown(_markdown_table({
+                "#": [i + 1 for i in range(len(paths))],
+                "타입": [p.get('type', '일반') for p in paths],
+                "W (L·atm)": [f"{p['W']:.2f}" for p in paths],
+                "Q (L·atm)": [f"{p['Q']:.2f}" for p in paths],
+                "효율": [f"{p['efficiency']:.1f}%" for p in paths],
+            }))
 
     # 비교 그래프 - 경로가 있을 때만 표시
     if st.session_state.paths or st.session_state.optimal_path:
@@ -845,9 +649,10 @@ with tab1:
                 </p>
             </div>
             """, unsafe_allow_html=True)
-            W_rev = n * R * T1 * np.log(st.session_state.V2 / st.session_state.V1) if st.session_state.V1 > 0 and st.session_state.V2 > 0 else None
-            fig_w, _ = plot_work_comparison(st.session_state.paths, st.session_state.optimal_path, W_rev, dark_mode=st.session_state.dark_mode)
-            st.pyplot(fig_w)
+            W_rev = _reversible_work(st.session_state.P1, st.session_state.V1, st.session_state.V2)
+            fig_w = _work_comparison_figure(*_graph_keys(), W_rev, st.session_state.dark_mode,
+                                            st.session_state.paths, st.session_state.optimal_path)
+            st.plotly_chart(fig_w, use_container_width=True)
 
         with col_g2:
             st.markdown("""
@@ -859,8 +664,9 @@ with tab1:
                 </p>
             </div>
             """, unsafe_allow_html=True)
-            fig_e, _ = plot_efficiency_comparison(st.session_state.paths, st.session_state.optimal_path, dark_mode=st.session_state.dark_mode)
-            st.pyplot(fig_e)
+            fig_e = _efficiency_comparison_figure(*_graph_keys(), st.session_state.dark_mode,
+                                                  st.session_state.paths, st.session_state.optimal_path)
+            st.plotly_chart(fig_e, use_container_width=True)
 
         # 종합 비교 (Plotly)
         st.markdown("""
@@ -874,12 +680,19 @@ with tab1:
             </p>
         </div>
         """, unsafe_allow_html=True)
-        fig_props = plot_thermodynamic_properties(st.session_state.paths, st.session_state.optimal_path, st.session_state.dark_mode)
-        st.plotly_chart(fig_props, use_container_width=True)
+        # 서브플롯 4개짜리 차트라 사용자가 켰을 때만 생성
+        if st.toggle("종합 비교 차트 표시", value=False, key="show_properties_chart"):
+            fig_props = _properties_figure(*_graph_keys(), st.session_state.dark_mode,
+                                           st.session_state.paths, st.session_state.optimal_path)
+            st.plotly_chart(fig_props, use_container_width=True)
 
         # 결과 내보내기
         st.divider()
-        csv_data = create_export_data(st.session_state.paths, st.session_state.optimal_path)
+        csv_data = _export_csv(
+            tuple(st.session_state.path_export_keys),
+            _export_key(st.session_state.optimal_path),
+            st.session_state.paths, st.session_state.optimal_path
+        )
         st.download_button(
             label="📥 결과 CSV 다운로드",
             data=csv_data,
@@ -887,8 +700,64 @@ with tab1:
             mime="text/csv"
         )
 
+# 사이클 선택지별 설정 (선택 상자 순서 = 딕셔너리 순서)
+# sliders: (생성 함수 인자 이름, 라벨, 최소, 최대, 기본값, 간격)
+# fixed: 세션 상태에서 나머지 생성 인자를 만드는 함수
+_CYCLE_SPECS = {
+    "Otto (오토)": {
+        'name': 'otto',
+        'label': '오토',
+        'intro': """
+            <div style="background: rgba(251, 146, 60, 0.1); border-radius: 12px; padding: 1rem; margin-bottom: 1rem;">
+                <strong style="color: #fb923c;">🚗 오토 사이클</strong>
+                <p style="color: #94a3b8; font-size: 0.9rem; margin: 0.5rem 0 0 0;">
+                    가솔린 엔진의 작동 원리!<br>
+                    압축비가 높을수록 효율이 좋아요.
+                </p>
+            </div>
+            """,
+        'sliders': [
+            ('compression_ratio', "압축비 (r)", 5.0, 15.0, 8.0, 0.5),
+            ('heat_added', "추가 열량 (L·atm)", 10.0, 100.0, 50.0, 5.0),
+        ],
+        'fixed': lambda state: dict(V1=state.V1 * 2, V2=state.V1, P1=1.0, gas_type=state.gas_type),
+    },
+    "Diesel (디젤)": {
+        'name': 'diesel',
+        'label': '디젤',
+        'intro': "**디젤 사이클 (디젤 엔진)**",
+        'sliders': [
+            ('compression_ratio', "압축비 (r)", 10.0, 25.0, 18.0, 0.5),
+            ('cutoff_ratio', "차단비 (rc)", 1.5, 4.0, 2.5, 0.1),
+        ],
+        'fixed': lambda state: dict(V1=state.V1 * 2, P1=1.0, gas_type=state.gas_type),
+    },
+    "Brayton (브레이턴)": {
+        'name': 'brayton',
+        'label': '브레이턴',
+        'intro': "**브레이턴 사이클 (가스 터빈)**",
+        'sliders': [
+            ('pressure_ratio', "압력비 (rp)", 5.0, 20.0, 10.0, 0.5),
+            ('T3', "최고 온도 (K)", 800.0, 1500.0, 1200.0, 50.0),
+        ],
+        'fixed': lambda state: dict(P1=1.0, T1=300.0, gas_type='diatomic'),
+    },
+    "Carnot (카르노)": {
+        'name': 'carnot',
+        'label': '카르노',
+        'intro': "**카르노 사이클 (이론적 최대 효율)**",
+        'sliders': [
+            ('T_hot', "고온부 온도 (K)", 400.0, 1000.0, 600.0, 10.0),
+            ('T_cold', "저온부 온도 (K)", 200.0, 400.0, 300.0, 10.0),
+        ],
+        'fixed': lambda state: dict(P1=state.P1, V1=state.V1, gas_type=state.gas_type),
+    },
+}
+
+
 # 탭 2: 열역학 사이클
-with tab2:
+@st.fragment
+def _render_cycle_tab():
     # 사이클 설명 카드
     st.markdown("""
     <div class="glow-card fade-in">
@@ -921,90 +790,17 @@ with tab2:
     col_cycle1, col_cycle2 = st.columns([1, 2])
 
     with col_cycle1:
-        cycle_type = st.selectbox("사이클 선택", ["Otto (오토)", "Diesel (디젤)", "Brayton (브레이턴)", "Carnot (카르노)"])
+        cycle_type = st.selectbox("사이클 선택", list(_CYCLE_SPECS))
 
-        if "Otto" in cycle_type:
-            st.markdown("""
-            <div style="background: rgba(251, 146, 60, 0.1); border-radius: 12px; padding: 1rem; margin-bottom: 1rem;">
-                <strong style="color: #fb923c;">🚗 오토 사이클</strong>
-                <p style="color: #94a3b8; font-size: 0.9rem; margin: 0.5rem 0 0 0;">
-                    가솔린 엔진의 작동 원리!<br>
-                    압축비가 높을수록 효율이 좋아요.
-                </p>
-            </div>
-            """, unsafe_allow_html=True)
-            compression_ratio = st.slider("압축비 (r)", 5.0, 15.0, 8.0, 0.5)
-            heat_added = st.slider("추가 열량 (L·atm)", 10.0, 100.0, 50.0, 5.0)
+        spec = _CYCLE_SPECS[cycle_type]
+        st.markdown(spec['intro'], unsafe_allow_html=True)
+        with st.form(f"{spec['name']}_form", border=False):
+            params = {arg: st.slider(*slider) for arg, *slider in spec['sliders']}
 
-            if st.button("🔄 오토 사이클 생성", use_container_width=True):
+            if st.form_submit_button(f"🔄 {spec['label']} 사이클 생성", use_container_width=True):
                 try:
-                    cycle = generate_otto_cycle(
-                        V1=st.session_state.V1 * 2,
-                        V2=st.session_state.V1,
-                        P1=1.0,
-                        compression_ratio=compression_ratio,
-                        heat_added=heat_added,
-                        gas_type=st.session_state.gas_type
-                    )
-                    st.session_state.cycle_data = cycle
-                    st.success(f"✅ 오토 사이클 생성! 효율: {cycle['efficiency']:.1f}%")
-                except Exception as e:
-                    st.error(f"오류: {e}")
-
-        elif "Diesel" in cycle_type:
-            st.markdown("**디젤 사이클 (디젤 엔진)**")
-            compression_ratio = st.slider("압축비 (r)", 10.0, 25.0, 18.0, 0.5)
-            cutoff_ratio = st.slider("차단비 (rc)", 1.5, 4.0, 2.5, 0.1)
-
-            if st.button("🔄 디젤 사이클 생성", use_container_width=True):
-                try:
-                    cycle = generate_diesel_cycle(
-                        V1=st.session_state.V1 * 2,
-                        P1=1.0,
-                        compression_ratio=compression_ratio,
-                        cutoff_ratio=cutoff_ratio,
-                        gas_type=st.session_state.gas_type
-                    )
-                    st.session_state.cycle_data = cycle
-                    st.success(f"✅ 디젤 사이클 생성! 효율: {cycle['efficiency']:.1f}%")
-                except Exception as e:
-                    st.error(f"오류: {e}")
-
-        elif "Brayton" in cycle_type:
-            st.markdown("**브레이턴 사이클 (가스 터빈)**")
-            pressure_ratio = st.slider("압력비 (rp)", 5.0, 20.0, 10.0, 0.5)
-            T_max = st.slider("최고 온도 (K)", 800.0, 1500.0, 1200.0, 50.0)
-
-            if st.button("🔄 브레이턴 사이클 생성", use_container_width=True):
-                try:
-                    cycle = generate_brayton_cycle(
-                        P1=1.0,
-                        T1=300.0,
-                        pressure_ratio=pressure_ratio,
-                        T3=T_max,
-                        gas_type='diatomic'
-                    )
-                    st.session_state.cycle_data = cycle
-                    st.success(f"✅ 브레이턴 사이클 생성! 효율: {cycle['efficiency']:.1f}%")
-                except Exception as e:
-                    st.error(f"오류: {e}")
-
-        elif "Carnot" in cycle_type:
-            st.markdown("**카르노 사이클 (이론적 최대 효율)**")
-            T_hot = st.slider("고온부 온도 (K)", 400.0, 1000.0, 600.0, 10.0)
-            T_cold = st.slider("저온부 온도 (K)", 200.0, 400.0, 300.0, 10.0)
-
-            if st.button("🔄 카르노 사이클 생성", use_container_width=True):
-                try:
-                    cycle = generate_carnot_cycle(
-                        P1=st.session_state.P1,
-                        V1=st.session_state.V1,
-                        T_hot=T_hot,
-                        T_cold=T_cold,
-                        gas_type=st.session_state.gas_type
-                    )
-                    st.session_state.cycle_data = cycle
-                    st.success(f"✅ 카르노 사이클 생성! 효율: {cycle['efficiency']:.1f}%")
+                    cycle = _generate_cycle(spec['name'], **spec['fixed'](st.session_state), **params)
+                    st.success(f"✅ {spec['label']} 사이클 생성! 효율: {cycle['efficiency']:.1f}%")
                 except Exception as e:
                     st.error(f"오류: {e}")
 
@@ -1013,34 +809,24 @@ with tab2:
             cycle = st.session_state.cycle_data
 
             # 사이클 다이어그램
-            fig_cycle = plot_cycle_diagram(cycle, st.session_state.dark_mode)
+            fig_cycle = _cycle_figure(st.session_state.cycle_key, st.session_state.dark_mode, cycle)
             st.plotly_chart(fig_cycle, use_container_width=True)
 
+            metrics_html, states_table = _cycle_summary(st.session_state.cycle_key, cycle)
+
             # 사이클 정보
             st.markdown("### 📊 사이클 성능")
-            col_m1, col_m2, col_m3, col_m4 = st.columns(4)
-            with col_m1:
-                st.metric("효율", f"{cycle['efficiency']:.1f}%")
-            with col_m2:
-                st.metric("순일", f"{cycle['W_net']:.2f} L·atm")
-            with col_m3:
-                st.metric("흡수 열", f"{cycle['Q_in']:.2f} L·atm")
-            with col_m4:
-                st.metric("방출 열", f"{cycle['Q_out']:.2f} L·atm")
+            st.markdown(metrics_html, unsafe_allow_html=True)
 
             # 상태점 테이블
             st.markdown("### 📋 상태점")
-            states = cycle['states']
-            state_df = pd.DataFrame([
-                {"상태": name, "P (atm)": f"{s['P']:.2f}", "V (L)": f"{s['V']:.2f}", "T (K)": f"{s['T']:.1f}"}
-                for name, s in states.items()
-            ])
-            st.dataframe(state_df, use_container_width=True, hide_index=True)
+            st.markdown(states_table)
         else:
             st.info("👈 왼쪽에서 사이클을 선택하고 생성해주세요.")
 
 # 탭 3: 3D 시각화
-with tab3:
+@st.fragment
+def _render_3d_tab():
     # 3D 설명 카드
     st.markdown("""
     <div class="glow-card fade-in">
@@ -1062,14 +848,14 @@ with tab3:
     with col_3d1:
         show_surface = st.checkbox("상태방정식 표면 표시", value=True, help="PV=nRT 표면을 보여줍니다")
 
-        fig_3d = plot_3d_pvt_diagram(
-            st.session_state.paths,
-            st.session_state.optimal_path,
+        fig_3d = _pvt_3d_figure(
+            *_graph_keys(),
             st.session_state.P1, st.session_state.V1,
             st.session_state.P2, st.session_state.V2,
-            show_surface=show_surface,
-            dark_mode=st.session_state.dark_mode
+            st.session_state.dark_mode,
+            st.session_state.paths, st.session_state.optimal_path
         )
+        fig_3d.update_traces(visible=show_surface, selector=dict(type='surface'))
         st.plotly_chart(fig_3d, use_container_width=True)
 
     with col_3d2:
@@ -1097,13 +883,15 @@ with tab3:
 
         if st.session_state.paths or st.session_state.optimal_path:
             st.markdown("### 📊 현재 경로")
-            for i, path in enumerate(st.session_state.paths):
-                st.write(f"경로 {i+1}: {path.get('type', '일반')}")
+            lines = [f"- 경로 {i+1}: {path.get('type', '일반')}"
+                     for i, path in enumerate(st.session_state.paths)]
             if st.session_state.optimal_path:
-                st.write("⭐ 최적 경로")
+                lines.append("- ⭐ 최적 경로")
+            st.markdown("\n".join(lines))
 
 # 탭 4: 알고리즘 비교
-with tab4:
+@st.fragment
+def _render_algorithm_tab():
     # 알고리즘 설명 카드
     st.markdown("""
     <div class="glow-card fade-in">
@@ -1133,12 +921,14 @@ with tab4:
     </div>
     """, unsafe_allow_html=True)
 
-    grid_size = st.slider("격자 크기", 20, 100, 50, 10)
+    with st.form("compare_form", border=False):
+        grid_size = st.slider("격자 크기", 20, 100, 50, 10)
+        run_compare = st.form_submit_button("🔬 알고리즘 비교 실행", use_container_width=True, type="primary")
 
-    if st.button("🔬 알고리즘 비교 실행", use_container_width=True, type="primary"):
+    if run_compare:
         with st.spinner("알고리즘 비교 중..."):
             try:
-                results = compare_algorithms(
+                results = _compare_algorithms(
                     st.session_state.P1, st.session_state.V1,
                     st.session_state.P2, st.session_state.V2,
                     grid_size=grid_size,
@@ -1146,34 +936,48 @@ with tab4:
                 )
 
                 # 결과 시각화
+                from visualization import plot_algorithm_comparison
                 fig_compare = plot_algorithm_comparison(results, st.session_state.dark_mode)
                 st.plotly_chart(fig_compare, use_container_width=True)
 
                 # 상세 결과 테이블
                 st.markdown("### 📋 상세 결과")
-                result_data = []
-                for algo_name, data in results.items():
-                    result_data.append({
-                        "알고리즘": algo_name.replace("_", " ").title(),
-                        "계산 시간 (초)": f"{data['time']:.4f}",
-                        "찾은 일 (L·atm)": f"{data['result']['W']:.2f}" if data['result'] else "N/A",
-                        "효율 (%)": f"{data['result']['efficiency']:.1f}" if data['result'] else "N/A"
-                    })
-                st.dataframe(pd.DataFrame(result_data), use_container_width=True, hide_index=True)
-
-                # 결론
-                best_algo = min(results.items(), key=lambda x: x[1]['time'])
-                best_work = max(results.items(), key=lambda x: x[1]['result']['W'] if x[1]['result'] else 0)
+                st.markdown(_markdown_table({
+                    "알고리즘": [name.replace("_", " ").title() for name in results],
+                    "계산 시간 (초)": [f"{d['time']:.4f}" for d in results.values()],
+                    "찾은 일 (L·atm)": [f"{d['result']['W']:.2f}" if d['result'] else "N/A" for d in results.values()],
+                    "효율 (%)": [f"{d['result']['efficiency']:.1f}" if d['result'] else "N/A" for d in results.values()],
+                }))
+
+                # 결론: 가장 빠른 알고리즘과 가장 큰 일을 찾은 알고리즘을 한 번에 집계
+                # (경로를 못 찾은 결과의 일은 0으로 취급)
+                best_algo = best_work = None
+                best_W = 0
+                for name, d in results.items():
+                    W = d['result']['W'] if d['result'] else 0
+                    if best_algo is None or d['time'] < best_algo[1]['time']:
+                        best_algo = (name, d)
+                    if best_work is None or W > best_W:
+                        best_work, best_W = (name, d), W
 
                 st.success(f"""
                 **결론:**
                 - 가장 빠른 알고리즘: **{best_algo[0].replace('_', ' ').title()}** ({best_algo[1]['time']:.4f}초)
-                - 최대 일 발견: **{best_work[0].replace('_', ' ').title()}** ({best_work[1]['result']['W']:.2f} L·atm)
+                - 최대 일 발견: **{best_work[0].replace('_', ' ').title()}** ({best_W:.2f} L·atm)
                 """)
 
             except Exception as e:
                 st.error(f"오류: {e}")
 
+with tab1:
+    _render_path_analysis_tab()
+with tab2:
+    _render_cycle_tab()
+with tab3:
+    _render_3d_tab()
+with tab4:
+    _render_algorithm_tab()
+
 # 하단 정보
 st.divider()
 
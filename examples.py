@@ -9,6 +9,7 @@ from thermodynamics import (
     generate_isobaric_path,
     generate_isochoric_path,
     generate_adiabatic_path,
+    generate_adiabatic_paths,
     calculate_path_properties,
     generate_otto_cycle,
     generate_diesel_cycle,
@@ -17,6 +18,20 @@ from thermodynamics import (
 )
 
 
+def _join_paths(P_a, V_a, P_b, V_b):
+    """
+    두 경로를 이어 붙임 (두 번째 경로의 시작점은 첫 경로의 끝점과 같으므로 제외).
+    P, V를 한 버퍼의 두 행에 바로 써서 할당을 한 번으로 줄인다.
+    """
+    n_a = len(P_a)
+    joined = np.empty((2, n_a + len(P_b) - 1))
+    joined[0, :n_a] = P_a
+    joined[0, n_a:] = P_b[1:]
+    joined[1, :n_a] = V_a
+    joined[1, n_a:] = V_b[1:]
+    return joined[0], joined[1]
+
+
 def example_1_isothermal_vs_adiabatic(gas_type='monatomic'):
     """
     예제 1: 등온 vs 단열 비교
@@ -99,8 +114,7 @@ def example_3_inefficient_path(gas_type='monatomic'):
     P_step2, V_step2 = generate_isobaric_path(P2, V1, V2)
 
     # 경로 합치기
-    P_combined = np.concatenate([P_step1, P_step2[1:]])
-    V_combined = np.concatenate([V_step1, V_step2[1:]])
+    P_combined, V_combined = _join_paths(P_step1, V_step1, P_step2, V_step2)
     path_ineff = calculate_path_properties(P_combined, V_combined, "일반", gas_type)
     path_ineff['type'] = "등적+등압 (비효율)"
 
@@ -140,8 +154,7 @@ def example_4_multiple_paths(gas_type='monatomic'):
     P_mid = (P1 + P2) / 2
     P_isoV1, V_isoV1 = generate_isochoric_path(V1, P1, P_mid)
     P_isoP_mid, V_isoP_mid = generate_isobaric_path(P_mid, V1, V2)
-    P_combined = np.concatenate([P_isoV1, P_isoP_mid[1:]])
-    V_combined = np.concatenate([V_isoV1, V_isoP_mid[1:]])
+    P_combined, V_combined = _join_paths(P_isoV1, V_isoV1, P_isoP_mid, V_isoP_mid)
     path_combined = calculate_path_properties(P_combined, V_combined, "일반", gas_type)
     path_combined['type'] = "등적+등압"
     paths.append(path_combined)
@@ -218,12 +231,13 @@ def example_9_gas_type_comparison():
     P1, V1 = 5, 2
     P2, V2 = 1, 8
 
-    results = {}
-
-    for gas_type in ['monatomic', 'diatomic', 'polyatomic']:
-        P_adi, V_adi = generate_adiabatic_path(P1, V1, P2, V2, gas_type=gas_type)
-        path = calculate_path_properties(P_adi, V_adi, "단열", gas_type)
-        results[gas_type] = path
+    gas_types = ['monatomic', 'diatomic', 'polyatomic']
+    # 세 기체의 경로를 한 번에 만들고 행별로 성질 계산
+    P_adi, V_adi = generate_adiabatic_paths(P1, V1, P2, V2, gas_types)
+    results = {
+        gas_type: calculate_path_properties(P_row, V_adi, "단열", gas_type)
+        for gas_type, P_row in zip(gas_types, P_adi)
+    }
 
     return {
         'P1': P1, 'V1': V1, 'P2': P2, 'V2': V2,
@@ -5,12 +5,15 @@
 - 다양한 제약 조건 지원
 """
 
+import math
 import numpy as np
-import heapq
+from functools import lru_cache
+from numba import njit
 from typing import Dict, List, Tuple, Optional, Callable
 from thermodynamics import (
     calculate_work_general,
     calculate_entropy_change,
+    calculate_entropy_change_vec,
     calculate_temperature,
     get_gas_properties,
     R, n
@@ -57,7 +60,7 @@ def calculate_edge_weight(P1: float, V1: float, P2: float, V2: float,
     elif optimization_target == 'max_efficiency':
         T1 = calculate_temperature(P1, V1)
         if T1 > 0 and dV != 0:
-            W_rev = n * R * T1 * np.log(V2 / V1) if V2 > 0 and V1 > 0 else 0
+            W_rev = n * R * T1 * math.log(V2 / V1) if V2 > 0 and V1 > 0 else 0
             if W_rev != 0:
                 efficiency = W / W_rev
                 return -efficiency
@@ -113,90 +116,135 @@ def is_valid_edge(P1: float, V1: float, P2: float, V2: float,
     return True
 
 
-def build_graph(P_grid: np.ndarray, V_grid: np.ndarray,
-               allow_diagonal: bool = True,
-               optimization_target: str = 'max_work',
-               constraints: Optional[Dict] = None) -> Dict:
-    """격자 그래프 생성"""
-    graph = {}
-    grid_size = len(P_grid)
+def _edge_weights(P1: np.ndarray, V1: np.ndarray, P2: np.ndarray, V2: np.ndarray,
+                  optimization_target: str = 'max_work') -> np.ndarray:
+    """calculate_edge_weight의 배열 버전 (간선 배열 전체를 한 번에 계산)"""
+    dV = V2 - V1
+    W = (P1 + P2) / 2 * dV
 
-    # 8방향 인접 노드 (대각선 포함)
-    if allow_diagonal:
-        directions = [(-1, -1), (-1, 0), (-1, 1), (0, -1),
-                     (0, 1), (1, -1), (1, 0), (1, 1)]
-    else:
-        directions = [(-1, 0), (1, 0), (0, -1), (0, 1)]
+    if optimization_target == 'min_entropy':
+        dS = calculate_entropy_change_vec(P1, V1, P2, V2)
+        return np.where(dS > 0, np.abs(dS), 0.01)
 
-    for i in range(grid_size):
-        for j in range(grid_size):
-            node = (i, j)
-            graph[node] = []
+    if optimization_target == 'max_efficiency':
+        T1 = (P1 * V1) / (n * R)
+        with np.errstate(divide='ignore', invalid='ignore'):
+            W_rev = np.where((V2 > 0) & (V1 > 0), n * R * T1 * np.log(V2 / V1), 0.0)
+            efficiency = W / W_rev
+        return np.where((T1 > 0) & (dV != 0) & (W_rev != 0), -efficiency, 0.0)
 
-            P1 = P_grid[i]
-            V1 = V_grid[j]
+    return -W
 
-            for di, dj in directions:
-                ni, nj = i + di, j + dj
 
-                if 0 <= ni < grid_size and 0 <= nj < grid_size:
-                    P2 = P_grid[ni]
-                    V2 = V_grid[nj]
+def _valid_edges(P1: np.ndarray, V1: np.ndarray, P2: np.ndarray, V2: np.ndarray,
+                 constraints: Optional[Dict] = None) -> np.ndarray:
+    """is_valid_edge의 배열 버전 (엔트로피 체크 포함)"""
+    valid = (V2 >= 0.1) & (P2 >= 0.1)
 
-                    if is_valid_edge(P1, V1, P2, V2, constraints=constraints):
-                        weight = calculate_edge_weight(P1, V1, P2, V2, optimization_target)
-                        graph[node].append(((ni, nj), weight))
+    if constraints:
+        T2 = (P2 * V2) / (n * R)
 
-    return graph
+        if 'max_temperature' in constraints:
+            valid &= T2 <= constraints['max_temperature']
 
+        if 'min_pressure' in constraints:
+            valid &= P2 >= constraints['min_pressure']
 
-# ==================== Dijkstra 알고리즘 ====================
+        if 'max_pressure' in constraints:
+            valid &= P2 <= constraints['max_pressure']
 
-def dijkstra(graph: Dict, start: Tuple[int, int],
-            end: Tuple[int, int]) -> Tuple[Optional[List], float]:
-    """Dijkstra 알고리즘으로 최단(최적) 경로 찾기"""
-    distances = {node: float('inf') for node in graph}
-    distances[start] = 0
-    previous = {node: None for node in graph}
+        if 'isothermal_only' in constraints and constraints['isothermal_only']:
+            T1 = (P1 * V1) / (n * R)
+            valid &= np.abs(T2 - T1) <= 10
 
-    pq = [(0, start)]
-    visited = set()
+    valid &= calculate_entropy_change_vec(P1, V1, P2, V2) >= -0.1
+    return valid
 
-    while pq:
-        current_dist, current = heapq.heappop(pq)
 
-        if current in visited:
-            continue
+def build_graph(P_grid: np.ndarray, V_grid: np.ndarray,
+               allow_diagonal: bool = True,
+               optimization_target: str = 'max_work',
+               constraints: Optional[Dict] = None) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    격자 그래프 생성 (CSR 형식, 노드 id = i * grid_size + j)
 
-        visited.add(current)
+    Returns:
+        (indptr, neighbors, weights): 노드 u의 간선은
+        neighbors[indptr[u]:indptr[u + 1]], weights[indptr[u]:indptr[u + 1]]
+    """
+    P_grid = np.asarray(P_grid, dtype=np.float64)
+    V_grid = np.asarray(V_grid, dtype=np.float64)
+    grid_size = len(P_grid)
+    num_nodes = grid_size * grid_size
 
-        if current == end:
-            break
+    # 8방향 인접 노드 (대각선 포함)
+    if allow_diagonal:
+        directions = np.array([(-1, -1), (-1, 0), (-1, 1), (0, -1),
+                               (0, 1), (1, -1), (1, 0), (1, 1)])
+    else:
+        directions = np.array([(-1, 0), (1, 0), (0, -1), (0, 1)])
 
-        for neighbor, weight in graph.get(current, []):
-            if neighbor in visited:
-                continue
+    # (노드, 방향) 쌍을 한꺼번에 만든다. C 순서로 펼치면 노드별 방향 순서가 유지된다
+    ii, jj = np.meshgrid(np.arange(grid_size), np.arange(grid_size), indexing='ij')
+    ni = ii[..., None] + directions[:, 0]
+    nj = jj[..., None] + directions[:, 1]
+    in_grid = (ni >= 0) & (ni < grid_size) & (nj >= 0) & (nj < grid_size)
 
-            new_dist = current_dist + weight
+    i = np.broadcast_to(ii[..., None], ni.shape)[in_grid]
+    j = np.broadcast_to(jj[..., None], nj.shape)[in_grid]
+    ni = ni[in_grid]
+    nj = nj[in_grid]
+
+    P1, V1 = P_grid[i], V_grid[j]
+    P2, V2 = P_grid[ni], V_grid[nj]
+    valid = _valid_edges(P1, V1, P2, V2, constraints)
+
+    sources = i[valid] * grid_size + j[valid]
+    indptr = np.zeros(num_nodes + 1, dtype=np.int64)
+    np.cumsum(np.bincount(sources, minlength=num_nodes), out=indptr[1:])
+
+    neighbors = (ni[valid] * grid_size + nj[valid]).astype(np.int32)
+    weights = _edge_weights(P1[valid], V1[valid], P2[valid], V2[valid],
+                            optimization_target)
+    return indptr, neighbors, weights
+
+
+@lru_cache(maxsize=32)
+def _grid_graph(grid_size: int, allow_diagonal: bool, optimization_target: str,
+                constraint_items: Optional[Tuple] = None) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    기본 격자(create_grid)의 그래프 캐시.
+    constraints 딕셔너리는 해시할 수 없으므로 정렬된 (키, 값) 튜플로 받는다.
+    """
+    P_grid, V_grid = create_grid(grid_size=grid_size)
+    graph = build_graph(P_grid, V_grid,
+                        allow_diagonal=allow_diagonal,
+                        optimization_target=optimization_target,
+                        constraints=dict(constraint_items) if constraint_items else None)
+    for array in graph:
+        array.flags.writeable = False  # 캐시된 배열이 호출 쪽에서 바뀌지 않도록
+    return graph
 
-            if new_dist < distances[neighbor]:
-                distances[neighbor] = new_dist
-                previous[neighbor] = current
-                heapq.heappush(pq, (new_dist, neighbor))
 
-    # 경로 재구성
-    path = []
-    current = end
+# ==================== Dijkstra 알고리즘 ====================
 
-    if previous[current] is None and current != start:
+def dijkstra(graph: Tuple[np.ndarray, np.ndarray, np.ndarray],
+            start: Tuple[int, int],
+            end: Tuple[int, int]) -> Tuple[Optional[List], float]:
+    """Dijkstra 알고리즘으로 최단(최적) 경로 찾기 (graph는 build_graph의 CSR 배열)"""
+    indptr, neighbors, weights = graph
+    if len(indptr) <= 1:
         return None, float('inf')
 
-    while current is not None:
-        path.append(current)
-        current = previous[current]
+    # 노드 (i, j)를 i * grid_size + j로 펼치면 id 순서가 튜플 비교 순서와 같다
+    grid_size = math.isqrt(len(indptr) - 1)
+    start_id = start[0] * grid_size + start[1]
+    end_id = end[0] * grid_size + end[1]
+    came_from, cost = _dijkstra_numba(indptr, neighbors, weights, start_id, end_id)
 
-    path.reverse()
-    return path, distances[end]
+    if not np.isfinite(cost):
+        return None, float('inf')
+    return _reconstruct_path(came_from, end_id, grid_size), float(cost)
 
 
 # ==================== A* 알고리즘 ====================
@@ -210,7 +258,7 @@ def manhattan_heuristic(node: Tuple[int, int], goal: Tuple[int, int],
 def euclidean_heuristic(node: Tuple[int, int], goal: Tuple[int, int],
                        P_grid: np.ndarray, V_grid: np.ndarray) -> float:
     """유클리드 거리 휴리스틱"""
-    return np.sqrt((node[0] - goal[0])**2 + (node[1] - goal[1])**2)
+    return math.sqrt((node[0] - goal[0])**2 + (node[1] - goal[1])**2)
 
 
 def thermodynamic_heuristic(node: Tuple[int, int], goal: Tuple[int, int],
@@ -226,79 +274,257 @@ def thermodynamic_heuristic(node: Tuple[int, int], goal: Tuple[int, int],
 
     if V1 > 0 and V2 > 0 and T > 0:
         # 등온 과정의 최대 일 (음수로 변환)
-        W_max = -n * R * T * np.log(V2 / V1)
+        W_max = -n * R * T * math.log(V2 / V1)
         return W_max * 0.8  # 보수적 추정
 
     return euclidean_heuristic(node, goal, P_grid, V_grid)
 
 
-def astar(graph: Dict, start: Tuple[int, int], end: Tuple[int, int],
-         P_grid: np.ndarray, V_grid: np.ndarray,
-         heuristic: str = 'thermodynamic') -> Tuple[Optional[List], float]:
+def heuristic_table(goal: Tuple[int, int], P_grid: np.ndarray, V_grid: np.ndarray,
+                    heuristic: str = 'thermodynamic') -> np.ndarray:
+    """모든 격자점의 휴리스틱 값을 한 번에 계산 (노드 id 순서의 1차원 배열)"""
+    grid_size = len(P_grid)
+    ii, jj = np.meshgrid(np.arange(grid_size), np.arange(grid_size), indexing='ij')
+    di = (ii - goal[0]).ravel()
+    dj = (jj - goal[1]).ravel()
+
+    if heuristic == 'manhattan':
+        return (np.abs(di) + np.abs(dj)).astype(np.float64)
+
+    euclidean = np.sqrt((di**2 + dj**2).astype(np.float64))
+    if heuristic == 'euclidean':
+        return euclidean
+
+    # 열역학적 휴리스틱: 등온 과정의 최대 일 기반 (thermodynamic_heuristic과 동일)
+    P1 = np.repeat(P_grid, grid_size)
+    V1 = np.tile(V_grid, grid_size)
+    V2 = V_grid[goal[1]]
+    T = P1 * V1 / (n * R)
+    valid = (V1 > 0) & (V2 > 0) & (T > 0)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        W_max = -n * R * T * np.log(V2 / V1)
+    return np.where(valid, W_max * 0.8, euclidean)
+
+
+@lru_cache(maxsize=8)
+def _grid_heuristic_table(goal: Tuple[int, int], grid_size: int,
+                          heuristic: str) -> np.ndarray:
+    """
+    기본 격자(create_grid)의 휴리스틱 표 캐시.
+    표는 목표점·격자 크기·휴리스틱에만 의존하므로 같은 끝점으로 다시 탐색하면 재사용한다.
     """
-    A* 알고리즘으로 최적 경로 찾기
+    P_grid, V_grid = create_grid(grid_size=grid_size)
+    h = heuristic_table(goal, P_grid, V_grid, heuristic)
+    h.flags.writeable = False  # 캐시된 배열이 호출 쪽에서 바뀌지 않도록
+    return h
+
+
+def clear_pathfinding_cache() -> None:
+    """격자 그래프·휴리스틱 표 캐시 비우기 (각 캐시는 lru_cache로 크기가 제한됨)"""
+    _grid_graph.cache_clear()
+    _grid_heuristic_table.cache_clear()
+
+
+@njit(cache=True)
+def _heap_less(f, g, node, a, b):
+    """힙 원소 비교: (f, g, node) 사전식 순서 (heapq 튜플 비교와 동일)"""
+    if f[a] != f[b]:
+        return f[a] < f[b]
+    if g[a] != g[b]:
+        return g[a] < g[b]
+    return node[a] < node[b]
+
+
+@njit(cache=True)
+def _heap_push(f, g, node, size, fv, gv, nv):
+    f[size] = fv
+    g[size] = gv
+    node[size] = nv
+    pos = size
+    while pos > 0:
+        parent = (pos - 1) >> 1
+        if _heap_less(f, g, node, pos, parent):
+            f[pos], f[parent] = f[parent], f[pos]
+            g[pos], g[parent] = g[parent], g[pos]
+            node[pos], node[parent] = node[parent], node[pos]
+            pos = parent
+        else:
+            break
+    return size + 1
+
+
+@njit(cache=True)
+def _heap_pop(f, g, node, size):
+    top = node[0]
+    size -= 1
+    f[0] = f[size]
+    g[0] = g[size]
+    node[0] = node[size]
+    pos = 0
+    while True:
+        left = 2 * pos + 1
+        if left >= size:
+            break
+        child = left
+        if left + 1 < size and _heap_less(f, g, node, left + 1, left):
+            child = left + 1
+        if _heap_less(f, g, node, child, pos):
+            f[pos], f[child] = f[child], f[pos]
+            g[pos], g[child] = g[child], g[pos]
+            node[pos], node[child] = node[child], node[pos]
+            pos = child
+        else:
+            break
+    return top, size
 
-    Args:
-        heuristic: 휴리스틱 함수 선택
-            'manhattan' - 맨해튼 거리
-            'euclidean' - 유클리드 거리
-            'thermodynamic' - 열역학적 휴리스틱
+
+@njit(cache=True)
+def _astar_numba(indptr, neighbors, weights, h, start, goal):
     """
-    # 휴리스틱 함수 선택
-    if heuristic == 'manhattan':
-        h_func = manhattan_heuristic
-    elif heuristic == 'euclidean':
-        h_func = euclidean_heuristic
-    else:
-        h_func = thermodynamic_heuristic
+    배열 기반 A* (노드는 한 번 확정되면 다시 열지 않음)
+
+    Returns:
+        (came_from, g_goal): 이전 노드 배열, 목표까지 비용 (도달 불가 시 inf)
+    """
+    num_nodes = len(indptr) - 1
+    g_score = np.full(num_nodes, np.inf)
+    came_from = np.full(num_nodes, -1, dtype=np.int64)
+    in_open = np.zeros(num_nodes, dtype=np.bool_)
+    closed = np.zeros(num_nodes, dtype=np.bool_)
+
+    # 각 노드는 최대 한 번만 힙에 들어가므로 크기 N이면 충분
+    heap_f = np.empty(num_nodes)
+    heap_g = np.empty(num_nodes)
+    heap_node = np.empty(num_nodes, dtype=np.int64)
+
+    g_score[start] = 0.0
+    size = _heap_push(heap_f, heap_g, heap_node, 0, h[start], 0.0, start)
+    in_open[start] = True
+
+    while size > 0:
+        current, size = _heap_pop(heap_f, heap_g, heap_node, size)
+        in_open[current] = False
+        closed[current] = True
+
+        if current == goal:
+            return came_from, g_score[goal]
+
+        for k in range(indptr[current], indptr[current + 1]):
+            neighbor = neighbors[k]
+            if closed[neighbor]:
+                continue
 
-    # g(n): 시작점에서 현재 노드까지의 실제 비용
-    g_score = {node: float('inf') for node in graph}
-    g_score[start] = 0
+            tentative_g = g_score[current] + weights[k]
+            if tentative_g < g_score[neighbor]:
+                came_from[neighbor] = current
+                g_score[neighbor] = tentative_g
+                if not in_open[neighbor]:
+                    size = _heap_push(heap_f, heap_g, heap_node, size,
+                                      tentative_g + h[neighbor], tentative_g, neighbor)
+                    in_open[neighbor] = True
 
-    # f(n) = g(n) + h(n)
-    f_score = {node: float('inf') for node in graph}
-    f_score[start] = h_func(start, end, P_grid, V_grid)
+    return came_from, np.inf
 
-    # 이전 노드 추적
-    came_from = {}
 
-    # 우선순위 큐: (f_score, g_score, node)
-    # g_score를 추가하여 타이브레이킹
-    open_set = [(f_score[start], 0, start)]
-    open_set_hash = {start}
+@njit(cache=True)
+def _dijkstra_numba(indptr, neighbors, weights, start, goal):
+    """
+    배열 기반 Dijkstra (힙 순서는 (거리, 노드) 튜플 비교와 같음)
 
-    while open_set:
-        _, _, current = heapq.heappop(open_set)
+    가중치가 음수일 수 있어 한 노드가 여러 번 힙에 들어갈 수 있으므로
+    힙은 간선 수 + 1만큼 잡고, 이미 확정된 노드의 항목은 꺼낼 때 건너뛴다.
 
-        if current not in open_set_hash:
+    Returns:
+        (came_from, dist_goal): 이전 노드 배열, 목표까지 비용 (도달 불가 시 inf)
+    """
+    num_nodes = len(indptr) - 1
+    distances = np.full(num_nodes, np.inf)
+    came_from = np.full(num_nodes, -1, dtype=np.int64)
+    visited = np.zeros(num_nodes, dtype=np.bool_)
+
+    capacity = len(neighbors) + 1
+    heap_d = np.empty(capacity)
+    heap_zero = np.zeros(capacity)  # (거리, 노드) 비교라 두 번째 키는 항상 같음
+    heap_node = np.empty(capacity, dtype=np.int64)
+
+    distances[start] = 0.0
+    size = _heap_push(heap_d, heap_zero, heap_node, 0, 0.0, 0.0, start)
+
+    while size > 0:
+        current_dist = heap_d[0]
+        current, size = _heap_pop(heap_d, heap_zero, heap_node, size)
+        if visited[current]:
             continue
-        open_set_hash.discard(current)
+        visited[current] = True
 
-        if current == end:
-            # 경로 재구성
-            path = []
-            while current in came_from:
-                path.append(current)
-                current = came_from[current]
-            path.append(start)
-            path.reverse()
-            return path, g_score[end]
+        if current == goal:
+            return came_from, distances[goal]
 
-        for neighbor, weight in graph.get(current, []):
-            tentative_g = g_score[current] + weight
+        for k in range(indptr[current], indptr[current + 1]):
+            neighbor = neighbors[k]
+            if visited[neighbor]:
+                continue
 
-            if tentative_g < g_score[neighbor]:
+            new_dist = current_dist + weights[k]
+            if new_dist < distances[neighbor]:
+                distances[neighbor] = new_dist
                 came_from[neighbor] = current
-                g_score[neighbor] = tentative_g
-                f = tentative_g + h_func(neighbor, end, P_grid, V_grid)
-                f_score[neighbor] = f
+                size = _heap_push(heap_d, heap_zero, heap_node, size,
+                                  new_dist, 0.0, neighbor)
+
+    return came_from, np.inf
+
 
-                if neighbor not in open_set_hash:
-                    heapq.heappush(open_set, (f, tentative_g, neighbor))
-                    open_set_hash.add(neighbor)
+@njit(cache=True)
+def _trace_back(came_from, end_id):
+    """이전 노드 배열을 따라 시작점 → 끝점 순서의 노드 id 배열을 만든다"""
+    length = 0
+    current = end_id
+    while current != -1:
+        length += 1
+        current = came_from[current]
 
-    return None, float('inf')
+    path = np.empty(length, dtype=np.int64)
+    current = end_id
+    for k in range(length - 1, -1, -1):
+        path[k] = current
+        current = came_from[current]
+    return path
+
+
+def _reconstruct_path(came_from: np.ndarray, end_id: int, grid_size: int) -> List[Tuple[int, int]]:
+    """이전 노드 배열을 따라 (i, j) 경로 복원"""
+    rows, cols = np.divmod(_trace_back(came_from, end_id), grid_size)
+    return list(zip(rows.tolist(), cols.tolist()))
+
+
+def astar(graph: Tuple[np.ndarray, np.ndarray, np.ndarray],
+         start: Tuple[int, int], end: Tuple[int, int],
+         P_grid: np.ndarray, V_grid: np.ndarray,
+         heuristic: str = 'thermodynamic',
+         h: Optional[np.ndarray] = None) -> Tuple[Optional[List], float]:
+    """
+    A* 알고리즘으로 최적 경로 찾기 (graph는 build_graph의 CSR 배열)
+
+    Args:
+        heuristic: 휴리스틱 함수 선택
+            'manhattan' - 맨해튼 거리
+            'euclidean' - 유클리드 거리
+            'thermodynamic' - 열역학적 휴리스틱
+        h: 미리 계산한 휴리스틱 표 (없으면 heuristic으로 계산)
+    """
+    grid_size = len(P_grid)
+    indptr, neighbors, weights = graph
+    if h is None:
+        h = heuristic_table(end, P_grid, V_grid, heuristic)
+
+    start_id = start[0] * grid_size + start[1]
+    end_id = end[0] * grid_size + end[1]
+    came_from, cost = _astar_numba(indptr, neighbors, weights, h, start_id, end_id)
+
+    if not np.isfinite(cost):
+        return None, float('inf')
+    return _reconstruct_path(came_from, end_id, grid_size), float(cost)
 
 
 # ==================== 메인 함수들 ====================
@@ -310,7 +536,8 @@ def find_optimal_path(P1: float, V1: float, P2: float, V2: float,
                      optimization_target: str = 'max_work',
                      heuristic: str = 'thermodynamic',
                      constraints: Optional[Dict] = None,
-                     gas_type: str = 'monatomic') -> Optional[Dict]:
+                     gas_type: str = 'monatomic',
+                     graph: Optional[Tuple[np.ndarray, np.ndarray, np.ndarray]] = None) -> Optional[Dict]:
     """
     최적 경로 찾기 (메인 함수)
 
@@ -320,6 +547,7 @@ def find_optimal_path(P1: float, V1: float, P2: float, V2: float,
         heuristic: A* 알고리즘용 휴리스틱
         constraints: 추가 제약 조건
         gas_type: 기체 타입
+        graph: 같은 격자·조건으로 미리 만든 그래프 (없으면 캐시에서 가져오거나 새로 생성)
     """
     # 격자 생성
     P_grid, V_grid = create_grid(grid_size=grid_size)
@@ -328,19 +556,19 @@ def find_optimal_path(P1: float, V1: float, P2: float, V2: float,
     start_i, start_j = find_nearest_grid_point(P1, V1, P_grid, V_grid)
     end_i, end_j = find_nearest_grid_point(P2, V2, P_grid, V_grid)
 
-    start_node = (start_i, start_j)
-    end_node = (end_i, end_j)
+    start_node = (int(start_i), int(start_j))
+    end_node = (int(end_i), int(end_j))
 
-    # 그래프 생성
-    graph = build_graph(P_grid, V_grid,
-                       allow_diagonal=allow_diagonal,
-                       optimization_target=optimization_target,
-                       constraints=constraints)
+    # 그래프 생성 (같은 격자·조건이면 캐시된 그래프 재사용)
+    if graph is None:
+        constraint_items = tuple(sorted(constraints.items())) if constraints else None
+        graph = _grid_graph(grid_size, allow_diagonal, optimization_target, constraint_items)
 
     # 알고리즘 실행
     if algorithm == 'astar':
+        h = _grid_heuristic_table(end_node, grid_size, heuristic)
         path_nodes, total_cost = astar(graph, start_node, end_node,
-                                       P_grid, V_grid, heuristic)
+                                       P_grid, V_grid, heuristic, h=h)
     else:
         path_nodes, total_cost = dijkstra(graph, start_node, end_node)
 
@@ -348,33 +576,27 @@ def find_optimal_path(P1: float, V1: float, P2: float, V2: float,
         return None
 
     # 경로를 P, V 배열로 변환
-    P_array = np.array([P_grid[i] for i, j in path_nodes])
-    V_array = np.array([V_grid[j] for i, j in path_nodes])
+    rows, cols = zip(*path_nodes)
+    P_array = P_grid.take(rows)
+    V_array = V_grid.take(cols)
 
     # 일 계산
     W = calculate_work_general(P_array, V_array)
 
-    # 다른 성질들 계산
+    # 다른 성질들 계산 (양 끝 상태의 T와 ln(V2/V1)을 한 번만 구해 재사용)
     from thermodynamics import (
-        calculate_internal_energy_change,
+        calculate_state_changes,
         calculate_heat,
-        calculate_entropy_change,
-        calculate_efficiency,
-        calculate_enthalpy_change,
-        calculate_gibbs_free_energy_change
+        calculate_efficiency
     )
 
-    dU = calculate_internal_energy_change(P1, V1, P2, V2, gas_type)
-    dH = calculate_enthalpy_change(P1, V1, P2, V2, gas_type)
+    changes = calculate_state_changes(P1, V1, P2, V2, gas_type)
+    dU, dH, dS, dG = changes['dU'], changes['dH'], changes['dS'], changes['dG']
     Q = calculate_heat(dU, W)
-    dS = calculate_entropy_change(P1, V1, P2, V2, gas_type)
-    dG = calculate_gibbs_free_energy_change(P1, V1, P2, V2, gas_type)
 
     # 가역 과정 일
-    T1 = calculate_temperature(P1, V1)
-    if V1 > 0 and V2 > 0:
-        W_reversible = n * R * T1 * np.log(V2 / V1)
-    else:
+    W_reversible = changes['W_reversible']
+    if W_reversible is None:
         W_reversible = abs(W)
 
     efficiency = calculate_efficiency(W, W_reversible)
@@ -399,6 +621,34 @@ def find_optimal_path(P1: float, V1: float, P2: float, V2: float,
     }
 
 
+def find_optimal_paths_batch(queries: List[Tuple[float, float, float, float]],
+                             grid_size: int = 50,
+                             allow_diagonal: bool = True,
+                             algorithm: str = 'dijkstra',
+                             optimization_target: str = 'max_work',
+                             heuristic: str = 'thermodynamic',
+                             constraints: Optional[Dict] = None,
+                             gas_type: str = 'monatomic') -> List[Optional[Dict]]:
+    """
+    여러 (P1, V1, P2, V2) 질의의 최적 경로를 한 번에 찾기
+
+    모든 질의가 같은 격자·조건을 쓰므로 그래프는 한 번만 만들고 탐색만 질의마다 수행한다.
+    결과 순서는 queries 순서와 같다 (경로가 없으면 None).
+    """
+    constraint_items = tuple(sorted(constraints.items())) if constraints else None
+    graph = _grid_graph(grid_size, allow_diagonal, optimization_target, constraint_items)
+
+    return [find_optimal_path(P1, V1, P2, V2, grid_size,
+                              allow_diagonal=allow_diagonal,
+                              algorithm=algorithm,
+                              optimization_target=optimization_target,
+                              heuristic=heuristic,
+                              constraints=constraints,
+                              gas_type=gas_type,
+                              graph=graph)
+            for P1, V1, P2, V2 in queries]
+
+
 def compare_algorithms(P1: float, V1: float, P2: float, V2: float,
                       grid_size: int = 50,
                       gas_type: str = 'monatomic') -> Dict:
@@ -407,11 +657,16 @@ def compare_algorithms(P1: float, V1: float, P2: float, V2: float,
 
     results = {}
 
+    # 네 탐색 모두 같은 격자·가중치를 쓰므로 그래프는 한 번만 만든다
+    # (측정 시간은 그래프 생성을 뺀 탐색 시간)
+    graph = _grid_graph(grid_size, True, 'max_work')
+
     # Dijkstra
     start_time = time.time()
     dijkstra_result = find_optimal_path(P1, V1, P2, V2, grid_size,
                                         algorithm='dijkstra',
-                                        gas_type=gas_type)
+                                        gas_type=gas_type,
+                                        graph=graph)
     dijkstra_time = time.time() - start_time
     results['dijkstra'] = {
         'result': dijkstra_result,
@@ -424,7 +679,8 @@ def compare_algorithms(P1: float, V1: float, P2: float, V2: float,
         astar_result = find_optimal_path(P1, V1, P2, V2, grid_size,
                                          algorithm='astar',
                                          heuristic=heuristic,
-                                         gas_type=gas_type)
+                                         gas_type=gas_type,
+                                         graph=graph)
         astar_time = time.time() - start_time
         results[f'astar_{heuristic}'] = {
             'result': astar_result,
@@ -441,6 +697,7 @@ def find_multiple_paths(P1: float, V1: float, P2: float, V2: float,
     """
     여러 개의 대안 경로 찾기
     K-shortest paths 변형 알고리즘
+    (그래프는 최적화 목표별로 한 번만 만들어지고, A* 탐색은 max_work 그래프를 재사용)
     """
     paths = []
 
@@ -458,7 +715,8 @@ def find_multiple_paths(P1: float, V1: float, P2: float, V2: float,
         alt_path = find_optimal_path(P1, V1, P2, V2, grid_size,
                                      optimization_target=target,
                                      gas_type=gas_type)
-        if alt_path and alt_path not in paths:
+        # 결과 딕셔너리에는 배열이 들어 있어 `in`으로 비교할 수 없으므로 경로 노드로 중복 판정
+        if alt_path and all(alt_path['path_nodes'] != path['path_nodes'] for path in paths):
             paths.append(alt_path)
 
     # A* 다른 휴리스틱으로
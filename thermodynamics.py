@@ -6,8 +6,8 @@
 - 엔탈피, 깁스 자유에너지 계산
 """
 
+import math
 import numpy as np
-from scipy import integrate
 from dataclasses import dataclass
 from typing import Tuple, Dict, Optional, List
 
@@ -54,7 +54,7 @@ def calculate_temperature(P: float, V: float, mol: float = n) -> float:
     이상기체 법칙으로 온도 계산
     PV = nRT → T = PV/(nR)
     """
-    if mol == 0 or R == 0:
+    if mol == 0:  # R은 0이 아닌 모듈 상수
         return 0
     return (P * V) / (mol * R)
 
@@ -86,7 +86,7 @@ def calculate_work_isothermal(P1: float, V1: float, P2: float, V2: float, mol: f
     T = calculate_temperature(P1, V1, mol)
     if V2 <= 0 or V1 <= 0:
         return 0
-    return mol * R * T * np.log(V2 / V1)
+    return mol * R * T * math.log(V2 / V1)
 
 
 def calculate_work_isobaric(P: float, V1: float, V2: float) -> float:
@@ -111,10 +111,12 @@ def calculate_work_adiabatic(P1: float, V1: float, P2: float, V2: float,
 
 
 def calculate_work_general(P_array: np.ndarray, V_array: np.ndarray) -> float:
-    """일반 경로의 일 (수치적분): W = ∫P dV"""
+    """일반 경로의 일 (사다리꼴 수치적분): W = ∫P dV ≈ Σ (P[i] + P[i+1]) / 2 · (V[i+1] - V[i])"""
     if len(P_array) < 2 or len(V_array) < 2:
         return 0.0
-    return integrate.trapezoid(P_array, V_array)
+    P_array = np.asarray(P_array, dtype=np.float64)
+    V_array = np.asarray(V_array, dtype=np.float64)
+    return float(0.5 * np.dot(P_array[1:] + P_array[:-1], np.diff(V_array)))
 
 
 # ==================== 열역학적 성질 변화 계산 ====================
@@ -157,21 +159,35 @@ def calculate_entropy_change(P1: float, V1: float, P2: float, V2: float,
     if V1 <= 0 or V2 <= 0 or T1 <= 0 or T2 <= 0:
         return 0.0
 
-    dS_volume = mol * R * np.log(V2 / V1)
-    dS_temperature = mol * Cv * np.log(T2 / T1)
+    # log1p: V2 ≈ V1, T2 ≈ T1일 때 비율을 만든 뒤 log를 취하며 생기는 자릿수 손실을 피한다
+    dS_volume = mol * R * math.log1p((V2 - V1) / V1)
+    dS_temperature = mol * Cv * math.log1p((T2 - T1) / T1)
     return dS_volume + dS_temperature
 
 
+def calculate_entropy_change_vec(P1: np.ndarray, V1: np.ndarray,
+                                 P2: np.ndarray, V2: np.ndarray,
+                                 gas_type: str = 'monatomic', mol: float = n) -> np.ndarray:
+    """
+    calculate_entropy_change의 배열 버전 (원소별로 같은 식, 무효한 상태는 0)
+    """
+    Cv = get_gas_properties(gas_type)['Cv']
+    T1 = (P1 * V1) / (mol * R)
+    T2 = (P2 * V2) / (mol * R)
+    valid = (V1 > 0) & (V2 > 0) & (T1 > 0) & (T2 > 0)
+
+    with np.errstate(divide='ignore', invalid='ignore'):
+        dS = mol * R * np.log(V2 / V1) + mol * Cv * np.log(T2 / T1)
+    return np.where(valid, dS, 0.0)
+
+
 def calculate_gibbs_free_energy_change(P1: float, V1: float, P2: float, V2: float,
                                        gas_type: str = 'monatomic', mol: float = n) -> float:
     """
     깁스 자유에너지 변화: ΔG = ΔH - TΔS
     (등온 과정 기준으로 계산)
     """
-    T1 = calculate_temperature(P1, V1, mol)
-    dH = calculate_enthalpy_change(P1, V1, P2, V2, gas_type, mol)
-    dS = calculate_entropy_change(P1, V1, P2, V2, gas_type, mol)
-    return dH - T1 * dS
+    return calculate_state_changes(P1, V1, P2, V2, gas_type, mol)['dG']
 
 
 def calculate_helmholtz_free_energy_change(P1: float, V1: float, P2: float, V2: float,
@@ -179,10 +195,7 @@ def calculate_helmholtz_free_energy_change(P1: float, V1: float, P2: float, V2:
     """
     헬름홀츠 자유에너지 변화: ΔA = ΔU - TΔS
     """
-    T1 = calculate_temperature(P1, V1, mol)
-    dU = calculate_internal_energy_change(P1, V1, P2, V2, gas_type, mol)
-    dS = calculate_entropy_change(P1, V1, P2, V2, gas_type, mol)
-    return dU - T1 * dS
+    return calculate_state_changes(P1, V1, P2, V2, gas_type, mol)['dA']
 
 
 def calculate_efficiency(W: float, W_reversible: float) -> float:
@@ -192,41 +205,124 @@ def calculate_efficiency(W: float, W_reversible: float) -> float:
     return (W / W_reversible) * 100
 
 
+def calculate_state_changes(P1: float, V1: float, P2: float, V2: float,
+                            gas_type: str = 'monatomic', mol: float = n) -> Dict:
+    """
+    양 끝 상태만으로 정해지는 변화량을 한 번에 계산 (개별 calculate_* 함수와 같은 식)
+    T1, T2, ln(V2/V1)을 한 번씩만 구해 ΔU, ΔH, ΔS, ΔG, ΔA와 등온 가역 일에 재사용한다.
+
+    Returns:
+        {'T1', 'T2', 'dU', 'dH', 'dS', 'dG', 'dA', 'W_reversible'}
+        (부피가 양수가 아니면 W_reversible은 None)
+    """
+    gas = get_gas_properties(gas_type)
+    T1 = calculate_temperature(P1, V1, mol)
+    T2 = calculate_temperature(P2, V2, mol)
+
+    # 내부에너지 변화, 엔탈피 변화
+    dU = mol * gas['Cv'] * (T2 - T1)
+    dH = mol * gas['Cp'] * (T2 - T1)
+
+    # 엔트로피 변화와 가역 과정 일 (등온 기준)이 같은 ln(V2/V1)을 쓴다
+    # (log1p로 V2 ≈ V1일 때의 자릿수 손실을 피함)
+    log_V = math.log1p((V2 - V1) / V1) if V1 > 0 and V2 > 0 else None
+    if log_V is None or T1 <= 0 or T2 <= 0:
+        dS = 0.0
+    else:
+        dS = mol * R * log_V + mol * gas['Cv'] * math.log1p((T2 - T1) / T1)
+
+    return {
+        'T1': T1,
+        'T2': T2,
+        'dU': dU,
+        'dH': dH,
+        'dS': dS,
+        'dG': dH - T1 * dS,  # 깁스 자유에너지 변화 (등온 과정 기준)
+        'dA': dU - T1 * dS,  # 헬름홀츠 자유에너지 변화
+        'W_reversible': None if log_V is None else mol * R * T1 * log_V
+    }
+
+
 # ==================== 경로 생성 함수들 ====================
 
+def _fill_isothermal(P_out: np.ndarray, V_out: np.ndarray,
+                     V1: float, V2: float, T: float, mol: float = n) -> None:
+    V_out[:] = np.linspace(V1, V2, len(V_out))
+    np.divide(mol * R * T, V_out, out=P_out)
+
+
+def _fill_isobaric(P_out: np.ndarray, V_out: np.ndarray,
+                   P: float, V1: float, V2: float) -> None:
+    V_out[:] = np.linspace(V1, V2, len(V_out))
+    P_out.fill(P)
+
+
+def _fill_isochoric(P_out: np.ndarray, V_out: np.ndarray,
+                    V: float, P1: float, P2: float) -> None:
+    P_out[:] = np.linspace(P1, P2, len(P_out))
+    V_out.fill(V)
+
+
+def _fill_adiabatic(P_out: np.ndarray, V_out: np.ndarray,
+                    P1: float, V1: float, V2: float, gamma: float) -> None:
+    V_out[:] = np.linspace(V1, V2, len(V_out))
+    np.power(V_out, gamma, out=P_out)
+    np.divide(P1 * (V1 ** gamma), P_out, out=P_out)
+
+
+def _path_buffers(num_paths: int, num_points: int) -> Tuple[np.ndarray, np.ndarray]:
+    """경로 num_paths개의 P, V를 담을 (num_paths, num_points) 배열 두 개 (한 번에 할당)"""
+    P_buffer, V_buffer = np.empty((2, num_paths, num_points))
+    return P_buffer, V_buffer
+
+
 def generate_isothermal_path(P1: float, V1: float, P2: float, V2: float,
                              num_points: int = 100, mol: float = n) -> Tuple[np.ndarray, np.ndarray]:
     """등온 경로 생성: PV = constant"""
     T = calculate_temperature(P1, V1, mol)
-    V_array = np.linspace(V1, V2, num_points)
-    P_array = (mol * R * T) / V_array
+    P_array, V_array = np.empty((2, num_points))
+    _fill_isothermal(P_array, V_array, V1, V2, T, mol)
     return P_array, V_array
 
 
 def generate_isobaric_path(P: float, V1: float, V2: float,
                            num_points: int = 100) -> Tuple[np.ndarray, np.ndarray]:
     """등압 경로 생성: P = constant"""
-    V_array = np.linspace(V1, V2, num_points)
-    P_array = np.full(num_points, P)
+    P_array, V_array = np.empty((2, num_points))
+    _fill_isobaric(P_array, V_array, P, V1, V2)
     return P_array, V_array
 
 
 def generate_isochoric_path(V: float, P1: float, P2: float,
                             num_points: int = 100) -> Tuple[np.ndarray, np.ndarray]:
     """등적 경로 생성: V = constant"""
-    P_array = np.linspace(P1, P2, num_points)
-    V_array = np.full(num_points, V)
+    P_array, V_array = np.empty((2, num_points))
+    _fill_isochoric(P_array, V_array, V, P1, P2)
     return P_array, V_array
 
 
 def generate_adiabatic_path(P1: float, V1: float, P2: float, V2: float,
                             num_points: int = 100, gas_type: str = 'monatomic') -> Tuple[np.ndarray, np.ndarray]:
     """단열 경로 생성: PV^γ = constant"""
-    gas = get_gas_properties(gas_type)
-    gamma = gas['gamma']
-    constant = P1 * (V1 ** gamma)
+    gamma = get_gas_properties(gas_type)['gamma']
+    P_array, V_array = np.empty((2, num_points))
+    _fill_adiabatic(P_array, V_array, P1, V1, V2, gamma)
+    return P_array, V_array
+
+
+def generate_adiabatic_paths(P1: float, V1: float, P2: float, V2: float,
+                             gas_types: List[str],
+                             num_points: int = 100) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    여러 기체의 단열 경로를 한 번에 생성 (γ를 열 벡터로 브로드캐스트)
+
+    Returns:
+        (P_array, V_array): P는 (기체 수, num_points) 배열로 행마다 한 기체,
+        V는 모든 행이 공유하는 1차원 배열
+    """
+    gammas = np.array([get_gas_properties(gas_type)['gamma'] for gas_type in gas_types])[:, None]
     V_array = np.linspace(V1, V2, num_points)
-    P_array = constant / (V_array ** gamma)
+    P_array = (P1 * (V1 ** gammas)) / (V_array ** gammas)
     return P_array, V_array
 
 
@@ -241,6 +337,45 @@ def generate_polytropic_path(P1: float, V1: float, P2: float, V2: float,
 
 # ==================== 열역학 사이클 ====================
 
+def _cycle_states(P: List[float], V: List[float], T: List[float]) -> Dict:
+    """사이클 상태점 1, 2, ...를 열(column) 배열로 묶음: {'names', 'P', 'V', 'T'}"""
+    return {
+        'names': [str(i + 1) for i in range(len(P))],
+        'P': np.array(P, dtype=float),
+        'V': np.array(V, dtype=float),
+        'T': np.array(T, dtype=float)
+    }
+
+
+def _otto_states(V1, P1, compression_ratio, heat_added, gamma, Cv, mol):
+    """
+    오토 사이클 상태점 (P, V, T 목록)과 Q_in, Q_out, 효율(비율). 스칼라와 배열 입력 모두 지원
+    r^(γ-1)은 압축·팽창 온도비와 효율에 함께 쓰이므로 한 번만 계산한다.
+    """
+    temperature_ratio = compression_ratio ** (gamma - 1)
+
+    # 상태 1: 초기 상태
+    T1 = (P1 * V1) / (mol * R)
+
+    # 상태 2: 단열 압축 후
+    V2 = V1 / compression_ratio
+    T2 = T1 * temperature_ratio
+    P2 = (mol * R * T2) / V2
+
+    # 상태 3: 등적 가열 후
+    T3 = T2 + heat_added / (mol * Cv)
+    P3 = (mol * R * T3) / V2
+
+    # 상태 4: 단열 팽창 후
+    T4 = T3 / temperature_ratio
+    P4 = (mol * R * T4) / V1
+
+    Q_in = mol * Cv * (T3 - T2)
+    Q_out = mol * Cv * (T4 - T1)
+    efficiency = 1 - (1 / temperature_ratio)
+    return [P1, P2, P3, P4], [V1, V2, V2, V1], [T1, T2, T3, T4], Q_in, Q_out, efficiency
+
+
 def generate_otto_cycle(V1: float, V2: float, P1: float, compression_ratio: float,
                         heat_added: float, gas_type: str = 'monatomic',
                         num_points: int = 50, mol: float = n) -> Dict:
@@ -263,57 +398,40 @@ def generate_otto_cycle(V1: float, V2: float, P1: float, compression_ratio: floa
     gamma = gas['gamma']
     Cv = gas['Cv']
 
-    # 상태 1: 초기 상태
-    T1 = calculate_temperature(P1, V1, mol)
+    P, V, T, Q_in, Q_out, efficiency = _otto_states(V1, P1, compression_ratio, heat_added,
+                                                    gamma, Cv, mol)
+    _, P2, P3, P4 = P
+    V2_calc = V[1]
 
-    # 상태 2: 단열 압축 후
-    V2_calc = V1 / compression_ratio
-    T2 = T1 * (compression_ratio ** (gamma - 1))
-    P2 = calculate_pressure(T2, V2_calc, mol)
-
-    # 상태 3: 등적 가열 후
-    T3 = T2 + heat_added / (mol * Cv)
-    P3 = calculate_pressure(T3, V2_calc, mol)
-
-    # 상태 4: 단열 팽창 후
-    T4 = T3 / (compression_ratio ** (gamma - 1))
-    P4 = calculate_pressure(T4, V1, mol)
-
-    # 경로 생성
-    paths = []
+    # 경로 생성 (네 구간의 P, V는 한 번 할당한 버퍼의 행에 바로 채운다)
+    P_seg, V_seg = _path_buffers(4, num_points)
 
     # 1→2: 단열 압축
-    P_12, V_12 = generate_adiabatic_path(P1, V1, P2, V2_calc, num_points, gas_type)
-    paths.append({'P': P_12, 'V': V_12, 'type': '단열 압축', 'step': '1→2'})
+    _fill_adiabatic(P_seg[0], V_seg[0], P1, V1, V2_calc, gamma)
 
     # 2→3: 등적 가열
-    P_23, V_23 = generate_isochoric_path(V2_calc, P2, P3, num_points)
-    paths.append({'P': P_23, 'V': V_23, 'type': '등적 가열', 'step': '2→3'})
+    _fill_isochoric(P_seg[1], V_seg[1], V2_calc, P2, P3)
 
     # 3→4: 단열 팽창
-    P_34, V_34 = generate_adiabatic_path(P3, V2_calc, P4, V1, num_points, gas_type)
-    paths.append({'P': P_34, 'V': V_34, 'type': '단열 팽창', 'step': '3→4'})
+    _fill_adiabatic(P_seg[2], V_seg[2], P3, V2_calc, V1, gamma)
 
     # 4→1: 등적 방열
-    P_41, V_41 = generate_isochoric_path(V1, P4, P1, num_points)
-    paths.append({'P': P_41, 'V': V_41, 'type': '등적 방열', 'step': '4→1'})
+    _fill_isochoric(P_seg[3], V_seg[3], V1, P4, P1)
 
-    # 효율 계산
-    efficiency = 1 - (1 / (compression_ratio ** (gamma - 1)))
+    # 구간 목록 (항상 네 구간이므로 리터럴 하나로 만든다)
+    paths = [
+        {'P': P_seg[0], 'V': V_seg[0], 'type': '단열 압축', 'step': '1→2'},
+        {'P': P_seg[1], 'V': V_seg[1], 'type': '등적 가열', 'step': '2→3'},
+        {'P': P_seg[2], 'V': V_seg[2], 'type': '단열 팽창', 'step': '3→4'},
+        {'P': P_seg[3], 'V': V_seg[3], 'type': '등적 방열', 'step': '4→1'},
+    ]
 
     # 일 계산
-    Q_in = mol * Cv * (T3 - T2)
-    Q_out = mol * Cv * (T4 - T1)
     W_net = Q_in - abs(Q_out)
 
     return {
         'paths': paths,
-        'states': {
-            '1': {'P': P1, 'V': V1, 'T': T1},
-            '2': {'P': P2, 'V': V2_calc, 'T': T2},
-            '3': {'P': P3, 'V': V2_calc, 'T': T3},
-            '4': {'P': P4, 'V': V1, 'T': T4}
-        },
+        'states': _cycle_states(P, V, T),
         'efficiency': efficiency * 100,
         'W_net': W_net,
         'Q_in': Q_in,
@@ -323,28 +441,20 @@ def generate_otto_cycle(V1: float, V2: float, P1: float, compression_ratio: floa
     }
 
 
-def generate_diesel_cycle(V1: float, P1: float, compression_ratio: float,
-                          cutoff_ratio: float, gas_type: str = 'monatomic',
-                          num_points: int = 50, mol: float = n) -> Dict:
+def _diesel_states(V1, P1, compression_ratio, cutoff_ratio, gamma, Cv, Cp, mol):
     """
-    디젤 사이클
-    1→2: 단열 압축
-    2→3: 등압 팽창 (연료 분사)
-    3→4: 단열 팽창
-    4→1: 등적 방열
+    디젤 사이클 상태점 (P, V, T 목록)과 Q_in, Q_out, 효율(비율). 스칼라와 배열 입력 모두 지원
+    r^(γ-1)은 압축 온도비와 효율에 함께 쓰이므로 한 번만 계산한다.
     """
-    gas = get_gas_properties(gas_type)
-    gamma = gas['gamma']
-    Cv = gas['Cv']
-    Cp = gas['Cp']
+    temperature_ratio = compression_ratio ** (gamma - 1)
 
     # 상태 1
-    T1 = calculate_temperature(P1, V1, mol)
+    T1 = (P1 * V1) / (mol * R)
 
     # 상태 2: 단열 압축 후
     V2 = V1 / compression_ratio
-    T2 = T1 * (compression_ratio ** (gamma - 1))
-    P2 = calculate_pressure(T2, V2, mol)
+    T2 = T1 * temperature_ratio
+    P2 = (mol * R * T2) / V2
 
     # 상태 3: 등압 팽창 후
     V3 = V2 * cutoff_ratio
@@ -354,44 +464,64 @@ def generate_diesel_cycle(V1: float, P1: float, compression_ratio: float,
     # 상태 4: 단열 팽창 후
     expansion_ratio = V1 / V3
     T4 = T3 / (expansion_ratio ** (gamma - 1))
-    P4 = calculate_pressure(T4, V1, mol)
+    P4 = (mol * R * T4) / V1
+
+    Q_in = mol * Cp * (T3 - T2)
+    Q_out = mol * Cv * (T4 - T1)
+    efficiency = 1 - (1 / temperature_ratio) * \
+                 ((cutoff_ratio ** gamma - 1) / (gamma * (cutoff_ratio - 1)))
+    return [P1, P2, P3, P4], [V1, V2, V3, V1], [T1, T2, T3, T4], Q_in, Q_out, efficiency
 
-    # 경로 생성
-    paths = []
+
+def generate_diesel_cycle(V1: float, P1: float, compression_ratio: float,
+                          cutoff_ratio: float, gas_type: str = 'monatomic',
+                          num_points: int = 50, mol: float = n) -> Dict:
+    """
+    디젤 사이클
+    1→2: 단열 압축
+    2→3: 등압 팽창 (연료 분사)
+    3→4: 단열 팽창
+    4→1: 등적 방열
+    """
+    gas = get_gas_properties(gas_type)
+    gamma = gas['gamma']
+    Cv = gas['Cv']
+    Cp = gas['Cp']
+
+    P, V, T, Q_in, Q_out, efficiency = _diesel_states(V1, P1, compression_ratio, cutoff_ratio,
+                                                      gamma, Cv, Cp, mol)
+    _, P2, P3, P4 = P
+    _, V2, V3, _ = V
+
+    # 경로 생성 (네 구간의 P, V는 한 번 할당한 버퍼의 행에 바로 채운다)
+    P_seg, V_seg = _path_buffers(4, num_points)
 
     # 1→2: 단열 압축
-    P_12, V_12 = generate_adiabatic_path(P1, V1, P2, V2, num_points, gas_type)
-    paths.append({'P': P_12, 'V': V_12, 'type': '단열 압축', 'step': '1→2'})
+    _fill_adiabatic(P_seg[0], V_seg[0], P1, V1, V2, gamma)
 
     # 2→3: 등압 팽창
-    P_23, V_23 = generate_isobaric_path(P2, V2, V3, num_points)
-    paths.append({'P': P_23, 'V': V_23, 'type': '등압 팽창', 'step': '2→3'})
+    _fill_isobaric(P_seg[1], V_seg[1], P2, V2, V3)
 
     # 3→4: 단열 팽창
-    P_34, V_34 = generate_adiabatic_path(P3, V3, P4, V1, num_points, gas_type)
-    paths.append({'P': P_34, 'V': V_34, 'type': '단열 팽창', 'step': '3→4'})
+    _fill_adiabatic(P_seg[2], V_seg[2], P3, V3, V1, gamma)
 
     # 4→1: 등적 방열
-    P_41, V_41 = generate_isochoric_path(V1, P4, P1, num_points)
-    paths.append({'P': P_41, 'V': V_41, 'type': '등적 방열', 'step': '4→1'})
+    _fill_isochoric(P_seg[3], V_seg[3], V1, P4, P1)
 
-    # 효율 계산
-    efficiency = 1 - (1 / (compression_ratio ** (gamma - 1))) * \
-                 ((cutoff_ratio ** gamma - 1) / (gamma * (cutoff_ratio - 1)))
+    # 구간 목록 (항상 네 구간이므로 리터럴 하나로 만든다)
+    paths = [
+        {'P': P_seg[0], 'V': V_seg[0], 'type': '단열 압축', 'step': '1→2'},
+        {'P': P_seg[1], 'V': V_seg[1], 'type': '등압 팽창', 'step': '2→3'},
+        {'P': P_seg[2], 'V': V_seg[2], 'type': '단열 팽창', 'step': '3→4'},
+        {'P': P_seg[3], 'V': V_seg[3], 'type': '등적 방열', 'step': '4→1'},
+    ]
 
     # 일 계산
-    Q_in = mol * Cp * (T3 - T2)
-    Q_out = mol * Cv * (T4 - T1)
     W_net = Q_in - abs(Q_out)
 
     return {
         'paths': paths,
-        'states': {
-            '1': {'P': P1, 'V': V1, 'T': T1},
-            '2': {'P': P2, 'V': V2, 'T': T2},
-            '3': {'P': P3, 'V': V3, 'T': T3},
-            '4': {'P': P4, 'V': V1, 'T': T4}
-        },
+        'states': _cycle_states(P, V, T),
         'efficiency': efficiency * 100,
         'W_net': W_net,
         'Q_in': Q_in,
@@ -402,6 +532,36 @@ def generate_diesel_cycle(V1: float, P1: float, compression_ratio: float,
     }
 
 
+def _brayton_states(P1, T1, pressure_ratio, T3, gamma, Cp, mol):
+    """
+    브레이턴 사이클 상태점 (P, V, T 목록)과 Q_in, Q_out, 효율(비율). 스칼라와 배열 입력 모두 지원
+    r_p^((γ-1)/γ)은 압축기·터빈 온도비와 효율에 함께 쓰이므로 한 번만 계산한다.
+    """
+    temperature_ratio = pressure_ratio ** ((gamma - 1) / gamma)
+
+    # 상태 1
+    V1 = (mol * R * T1) / P1
+
+    # 상태 2: 단열 압축 후
+    P2 = P1 * pressure_ratio
+    T2 = T1 * temperature_ratio
+    V2 = (mol * R * T2) / P2
+
+    # 상태 3: 등압 가열 후 (최고 온도)
+    P3 = P2
+    V3 = (mol * R * T3) / P3
+
+    # 상태 4: 단열 팽창 후
+    P4 = P1
+    T4 = T3 / temperature_ratio
+    V4 = (mol * R * T4) / P4
+
+    Q_in = mol * Cp * (T3 - T2)
+    Q_out = mol * Cp * (T4 - T1)
+    efficiency = 1 - (1 / temperature_ratio)
+    return [P1, P2, P3, P4], [V1, V2, V3, V4], [T1, T2, T3, T4], Q_in, Q_out, efficiency
+
+
 def generate_brayton_cycle(P1: float, T1: float, pressure_ratio: float,
                            T3: float, gas_type: str = 'diatomic',
                            num_points: int = 50, mol: float = n) -> Dict:
@@ -416,58 +576,40 @@ def generate_brayton_cycle(P1: float, T1: float, pressure_ratio: float,
     gamma = gas['gamma']
     Cp = gas['Cp']
 
-    # 상태 1
-    V1 = calculate_volume(T1, P1, mol)
+    P, V, T, Q_in, Q_out, efficiency = _brayton_states(P1, T1, pressure_ratio, T3,
+                                                       gamma, Cp, mol)
+    _, P2, P3, P4 = P
+    V1, V2, V3, V4 = V
 
-    # 상태 2: 단열 압축 후
-    P2 = P1 * pressure_ratio
-    T2 = T1 * (pressure_ratio ** ((gamma - 1) / gamma))
-    V2 = calculate_volume(T2, P2, mol)
-
-    # 상태 3: 등압 가열 후 (최고 온도)
-    P3 = P2
-    V3 = calculate_volume(T3, P3, mol)
-
-    # 상태 4: 단열 팽창 후
-    P4 = P1
-    T4 = T3 / (pressure_ratio ** ((gamma - 1) / gamma))
-    V4 = calculate_volume(T4, P4, mol)
-
-    # 경로 생성
-    paths = []
+    # 경로 생성 (네 구간의 P, V는 한 번 할당한 버퍼의 행에 바로 채운다)
+    P_seg, V_seg = _path_buffers(4, num_points)
 
     # 1→2: 단열 압축
-    P_12, V_12 = generate_adiabatic_path(P1, V1, P2, V2, num_points, gas_type)
-    paths.append({'P': P_12, 'V': V_12, 'type': '단열 압축', 'step': '1→2'})
+    _fill_adiabatic(P_seg[0], V_seg[0], P1, V1, V2, gamma)
 
     # 2→3: 등압 가열
-    P_23, V_23 = generate_isobaric_path(P2, V2, V3, num_points)
-    paths.append({'P': P_23, 'V': V_23, 'type': '등압 가열', 'step': '2→3'})
+    _fill_isobaric(P_seg[1], V_seg[1], P2, V2, V3)
 
     # 3→4: 단열 팽창
-    P_34, V_34 = generate_adiabatic_path(P3, V3, P4, V4, num_points, gas_type)
-    paths.append({'P': P_34, 'V': V_34, 'type': '단열 팽창', 'step': '3→4'})
+    _fill_adiabatic(P_seg[2], V_seg[2], P3, V3, V4, gamma)
 
     # 4→1: 등압 방열
-    P_41, V_41 = generate_isobaric_path(P4, V4, V1, num_points)
-    paths.append({'P': P_41, 'V': V_41, 'type': '등압 방열', 'step': '4→1'})
+    _fill_isobaric(P_seg[3], V_seg[3], P4, V4, V1)
 
-    # 효율 계산
-    efficiency = 1 - (1 / (pressure_ratio ** ((gamma - 1) / gamma)))
+    # 구간 목록 (항상 네 구간이므로 리터럴 하나로 만든다)
+    paths = [
+        {'P': P_seg[0], 'V': V_seg[0], 'type': '단열 압축', 'step': '1→2'},
+        {'P': P_seg[1], 'V': V_seg[1], 'type': '등압 가열', 'step': '2→3'},
+        {'P': P_seg[2], 'V': V_seg[2], 'type': '단열 팽창', 'step': '3→4'},
+        {'P': P_seg[3], 'V': V_seg[3], 'type': '등압 방열', 'step': '4→1'},
+    ]
 
     # 일 계산
-    Q_in = mol * Cp * (T3 - T2)
-    Q_out = mol * Cp * (T4 - T1)
     W_net = Q_in - abs(Q_out)
 
     return {
         'paths': paths,
-        'states': {
-            '1': {'P': P1, 'V': V1, 'T': T1},
-            '2': {'P': P2, 'V': V2, 'T': T2},
-            '3': {'P': P3, 'V': V3, 'T': T3},
-            '4': {'P': P4, 'V': V4, 'T': T4}
-        },
+        'states': _cycle_states(P, V, T),
         'efficiency': efficiency * 100,
         'W_net': W_net,
         'Q_in': Q_in,
@@ -477,6 +619,24 @@ def generate_brayton_cycle(P1: float, T1: float, pressure_ratio: float,
     }
 
 
+def _carnot_states(P1, V1, T_hot, T_cold, gamma, mol):
+    """카르노 사이클 상태점 (P, V, T 목록). 스칼라와 배열 입력 모두 지원"""
+    # 상태 2: 고온 등온선 끝, 단열선 시작 (V2 = 2·V1로 팽창)
+    V2 = V1 * 2
+    P2 = (mol * R * T_hot) / V2
+
+    # 상태 3: 저온 등온선 끝
+    # 단열 과정: T1*V2^(gamma-1) = T_cold*V3^(gamma-1)
+    V3 = V2 * ((T_hot / T_cold) ** (1 / (gamma - 1)))
+    P3 = (mol * R * T_cold) / V3
+
+    # 상태 4: 저온 등온선 시작
+    V4 = V1 * ((T_hot / T_cold) ** (1 / (gamma - 1)))
+    P4 = (mol * R * T_cold) / V4
+
+    return [P1, P2, P3, P4], [V1, V2, V3, V4], [T_hot, T_hot, T_cold, T_cold]
+
+
 def generate_carnot_cycle(P1: float, V1: float, T_hot: float, T_cold: float,
                           gas_type: str = 'monatomic', num_points: int = 50,
                           mol: float = n) -> Dict:
@@ -490,62 +650,49 @@ def generate_carnot_cycle(P1: float, V1: float, T_hot: float, T_cold: float,
     gas = get_gas_properties(gas_type)
     gamma = gas['gamma']
 
-    # 상태 1: 고온 등온선 시작
-    T1 = T_hot
-    # V1과 P1은 입력받음
-
-    # 상태 2: 고온 등온선 끝, 단열선 시작
-    # V2를 적절히 선택 (팽창)
-    V2 = V1 * 2
-    P2 = (mol * R * T_hot) / V2
-
-    # 상태 3: 저온 등온선 끝
-    # 단열 과정: T1*V2^(gamma-1) = T_cold*V3^(gamma-1)
-    V3 = V2 * ((T_hot / T_cold) ** (1 / (gamma - 1)))
-    P3 = (mol * R * T_cold) / V3
-
-    # 상태 4: 저온 등온선 시작
-    V4 = V1 * ((T_hot / T_cold) ** (1 / (gamma - 1)))
-    P4 = (mol * R * T_cold) / V4
+    # 상태 1: 고온 등온선 시작 (V1과 P1은 입력받음)
+    P, V, T = _carnot_states(P1, V1, T_hot, T_cold, gamma, mol)
+    _, P2, P3, P4 = P
+    _, V2, V3, V4 = V
 
-    # 경로 생성
-    paths = []
+    # 경로 생성 (네 구간의 P, V는 한 번 할당한 버퍼의 행에 바로 채운다)
+    # 등온선 온도는 generate_isothermal_path처럼 시작 상태의 PV에서 구한다
+    P_seg, V_seg = _path_buffers(4, num_points)
 
     # 1→2: 등온 팽창
-    P_12, V_12 = generate_isothermal_path(P1, V1, P2, V2, num_points, mol)
-    paths.append({'P': P_12, 'V': V_12, 'type': '등온 팽창', 'step': '1→2'})
+    _fill_isothermal(P_seg[0], V_seg[0], V1, V2, calculate_temperature(P1, V1, mol), mol)
 
     # 2→3: 단열 팽창
-    P_23, V_23 = generate_adiabatic_path(P2, V2, P3, V3, num_points, gas_type)
-    paths.append({'P': P_23, 'V': V_23, 'type': '단열 팽창', 'step': '2→3'})
+    _fill_adiabatic(P_seg[1], V_seg[1], P2, V2, V3, gamma)
 
     # 3→4: 등온 압축
-    P_34, V_34 = generate_isothermal_path(P3, V3, P4, V4, num_points, mol)
-    paths.append({'P': P_34, 'V': V_34, 'type': '등온 압축', 'step': '3→4'})
+    _fill_isothermal(P_seg[2], V_seg[2], V3, V4, calculate_temperature(P3, V3, mol), mol)
 
     # 4→1: 단열 압축
-    P_41, V_41 = generate_adiabatic_path(P4, V4, P1, V1, num_points, gas_type)
-    paths.append({'P': P_41, 'V': V_41, 'type': '단열 압축', 'step': '4→1'})
+    _fill_adiabatic(P_seg[3], V_seg[3], P4, V4, V1, gamma)
+
+    # 구간 목록 (항상 네 구간이므로 리터럴 하나로 만든다)
+    paths = [
+        {'P': P_seg[0], 'V': V_seg[0], 'type': '등온 팽창', 'step': '1→2'},
+        {'P': P_seg[1], 'V': V_seg[1], 'type': '단열 팽창', 'step': '2→3'},
+        {'P': P_seg[2], 'V': V_seg[2], 'type': '등온 압축', 'step': '3→4'},
+        {'P': P_seg[3], 'V': V_seg[3], 'type': '단열 압축', 'step': '4→1'},
+    ]
 
     # 카르노 효율
     efficiency = (1 - T_cold / T_hot) * 100
 
     # 일 계산
-    W_12 = mol * R * T_hot * np.log(V2 / V1)
-    W_34 = mol * R * T_cold * np.log(V4 / V3)
+    W_12 = mol * R * T_hot * math.log(V2 / V1)
+    W_34 = mol * R * T_cold * math.log(V4 / V3)
     W_net = W_12 + W_34  # W_23과 W_41은 상쇄
 
-    Q_in = mol * R * T_hot * np.log(V2 / V1)
-    Q_out = abs(mol * R * T_cold * np.log(V4 / V3))
+    Q_in = mol * R * T_hot * math.log(V2 / V1)
+    Q_out = abs(mol * R * T_cold * math.log(V4 / V3))
 
     return {
         'paths': paths,
-        'states': {
-            '1': {'P': P1, 'V': V1, 'T': T_hot},
-            '2': {'P': P2, 'V': V2, 'T': T_hot},
-            '3': {'P': P3, 'V': V3, 'T': T_cold},
-            '4': {'P': P4, 'V': V4, 'T': T_cold}
-        },
+        'states': _cycle_states(P, V, T),
         'efficiency': efficiency,
         'W_net': W_net,
         'Q_in': Q_in,
@@ -556,6 +703,80 @@ def generate_carnot_cycle(P1: float, V1: float, T_hot: float, T_cold: float,
     }
 
 
+# ==================== 사이클 일괄 계산 ====================
+
+def _cycle_batch(P: List, V: List, T: List, efficiency, Q_in, Q_out, W_net=None) -> Dict:
+    """
+    상태점 목록을 브로드캐스트해 (상태 수, ...) 배열로 쌓은 일괄 계산 결과.
+    W_net을 주지 않으면 Q_in - |Q_out|
+    """
+    P, V, T = (np.stack(np.broadcast_arrays(*values)).astype(float) for values in (P, V, T))
+    Q_in = np.asarray(Q_in, dtype=float)
+    Q_out = np.abs(Q_out)
+    return {
+        'P': P,
+        'V': V,
+        'T': T,
+        'efficiency': np.asarray(efficiency, dtype=float),
+        'W_net': Q_in - Q_out if W_net is None else np.asarray(W_net, dtype=float),
+        'Q_in': Q_in,
+        'Q_out': Q_out
+    }
+
+
+def generate_otto_cycle_batch(V1, P1, compression_ratio, heat_added,
+                              gas_type: str = 'monatomic', mol: float = n) -> Dict:
+    """
+    오토 사이클 상태점·성능을 여러 조건에 대해 한 번에 계산 (경로 배열은 만들지 않음)
+
+    인자는 스칼라나 서로 브로드캐스트 가능한 배열이면 된다 (예: 압축비 스윕).
+    Returns:
+        {'P', 'V', 'T'}: (4, ...) 배열 (상태 1~4), {'efficiency', 'W_net', 'Q_in', 'Q_out'}: (...) 배열
+    """
+    gas = get_gas_properties(gas_type)
+    gamma = gas['gamma']
+    compression_ratio = np.asarray(compression_ratio, dtype=float)
+    P, V, T, Q_in, Q_out, efficiency = _otto_states(V1, P1, compression_ratio, heat_added,
+                                                    gamma, gas['Cv'], mol)
+    return _cycle_batch(P, V, T, efficiency * 100, Q_in, Q_out)
+
+
+def generate_diesel_cycle_batch(V1, P1, compression_ratio, cutoff_ratio,
+                                gas_type: str = 'monatomic', mol: float = n) -> Dict:
+    """디젤 사이클 일괄 계산 (반환 형식은 generate_otto_cycle_batch와 같음)"""
+    gas = get_gas_properties(gas_type)
+    gamma = gas['gamma']
+    compression_ratio = np.asarray(compression_ratio, dtype=float)
+    P, V, T, Q_in, Q_out, efficiency = _diesel_states(V1, P1, compression_ratio, cutoff_ratio,
+                                                      gamma, gas['Cv'], gas['Cp'], mol)
+    return _cycle_batch(P, V, T, efficiency * 100, Q_in, Q_out)
+
+
+def generate_brayton_cycle_batch(P1, T1, pressure_ratio, T3,
+                                 gas_type: str = 'diatomic', mol: float = n) -> Dict:
+    """브레이턴 사이클 일괄 계산 (반환 형식은 generate_otto_cycle_batch와 같음)"""
+    gas = get_gas_properties(gas_type)
+    gamma = gas['gamma']
+    pressure_ratio = np.asarray(pressure_ratio, dtype=float)
+    P, V, T, Q_in, Q_out, efficiency = _brayton_states(P1, T1, pressure_ratio, T3,
+                                                       gamma, gas['Cp'], mol)
+    return _cycle_batch(P, V, T, efficiency * 100, Q_in, Q_out)
+
+
+def generate_carnot_cycle_batch(P1, V1, T_hot, T_cold,
+                                gas_type: str = 'monatomic', mol: float = n) -> Dict:
+    """카르노 사이클 일괄 계산 (반환 형식은 generate_otto_cycle_batch와 같음)"""
+    gamma = get_gas_properties(gas_type)['gamma']
+    T_hot = np.asarray(T_hot, dtype=float)
+    P, V, T = _carnot_states(P1, V1, T_hot, T_cold, gamma, mol)
+    _, V2, V3, V4 = V
+
+    Q_in = mol * R * T_hot * np.log(V2 / V1)
+    W_34 = mol * R * T_cold * np.log(V4 / V3)
+    efficiency = (1 - T_cold / T_hot) * 100
+    return _cycle_batch(P, V, T, efficiency, Q_in, W_34, W_net=Q_in + W_34)
+
+
 # ==================== 경로 속성 계산 ====================
 
 def calculate_path_properties(P_array: np.ndarray, V_array: np.ndarray,
@@ -580,26 +801,17 @@ def calculate_path_properties(P_array: np.ndarray, V_array: np.ndarray,
     else:
         W = calculate_work_general(P_array, V_array)
 
-    # 내부에너지 변화
-    dU = calculate_internal_energy_change(P1, V1, P2, V2, gas_type, mol)
-
-    # 엔탈피 변화
-    dH = calculate_enthalpy_change(P1, V1, P2, V2, gas_type, mol)
+    # 상태함수 변화는 양 끝 상태만으로 결정된다
+    changes = calculate_state_changes(P1, V1, P2, V2, gas_type, mol)
+    T1, T2 = changes['T1'], changes['T2']
+    dU, dH, dS, dG = changes['dU'], changes['dH'], changes['dS'], changes['dG']
 
     # 열
     Q = calculate_heat(dU, W)
 
-    # 엔트로피 변화
-    dS = calculate_entropy_change(P1, V1, P2, V2, gas_type, mol)
-
-    # 깁스 자유에너지 변화
-    dG = calculate_gibbs_free_energy_change(P1, V1, P2, V2, gas_type, mol)
-
-    # 가역 과정 일 (등온 기준)
-    T1 = calculate_temperature(P1, V1, mol)
-    if V1 > 0 and V2 > 0:
-        W_reversible = mol * R * T1 * np.log(V2 / V1)
-    else:
+    # 가역 과정 일 (등온 기준, 부피가 양수가 아니면 실제 일의 크기로 대신함)
+    W_reversible = changes['W_reversible']
+    if W_reversible is None:
         W_reversible = abs(W)
 
     # 효율
@@ -619,5 +831,5 @@ def calculate_path_properties(P_array: np.ndarray, V_array: np.ndarray,
         'type': path_type,
         'gas_type': gas_type,
         'T1': T1,
-        'T2': calculate_temperature(P2, V2, mol)
+        'T2': T2
     }
@@ -9,21 +9,132 @@
 import platform
 import numpy as np
 import os
+from functools import lru_cache
 
-# matplotlib 백엔드 설정 (GUI 없는 환경용)
-import matplotlib
-if os.environ.get('DISPLAY') is None:
-    matplotlib.use('Agg')
-
-import matplotlib.pyplot as plt
-import matplotlib.font_manager as fm
 import plotly.graph_objects as go
-import plotly.express as px
 from plotly.subplots import make_subplots
 from typing import List, Dict, Optional, Tuple
 from thermodynamics import calculate_temperature, R, n, GAS_TYPES
 
-# ==================== 한글 폰트 설정 ====================
+# ==================== 다운샘플링 ====================
+
+MAX_PLOT_POINTS = 500
+MAX_ANIMATION_FRAMES = 60  # 경로 하나당 애니메이션 프레임 수 상한
+
+
+def _downsample_path(P_array, V_array, n_out: int = MAX_PLOT_POINTS) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    LTTB(Largest-Triangle-Three-Buckets)로 경로 점 개수를 n_out 이하로 줄인다.
+    화면 해상도 이상의 점은 보이지 않으므로 모양은 유지하면서 렌더링 비용만 줄인다.
+
+    Args:
+        P_array: 압력 배열
+        V_array: 부피 배열
+        n_out: 최대 점 개수
+
+    Returns:
+        (P, V) 다운샘플링된 배열 (시작점과 끝점은 항상 포함)
+    """
+    P = np.asarray(P_array, dtype=float)
+    V = np.asarray(V_array, dtype=float)
+    N = len(P)
+    if N <= n_out or n_out < 3:
+        return P, V
+
+    idx = np.empty(n_out, dtype=np.intp)
+    idx[0], idx[-1] = 0, N - 1
+    # 가운데 점들을 n_out-2개의 버킷으로 나누고, 버킷마다 삼각형 넓이가 최대인 점 선택
+    edges = np.linspace(1, N - 1, n_out - 1).astype(np.intp)
+    a = 0
+    for k in range(n_out - 2):
+        lo, hi = edges[k], edges[k + 1]
+        nxt_lo, nxt_hi = edges[k + 1], edges[k + 2] if k + 2 < len(edges) else N
+        V_avg = V[nxt_lo:nxt_hi].mean()
+        P_avg = P[nxt_lo:nxt_hi].mean()
+        area = np.abs((V[a] - V_avg) * (P[lo:hi] - P[a]) -
+                      (V[a] - V[lo:hi]) * (P_avg - P[a]))
+        a = lo + int(np.argmax(area))
+        idx[k + 1] = a
+    return P[idx], V[idx]
+
+
+def _trace_array(values) -> np.ndarray:
+    """
+    Plotly 트레이스로 보낼 좌표 배열을 float32로 변환.
+    Plotly 6 이상은 numpy 배열을 이진(typed array)으로 전송하므로 페이로드가 절반이 되고,
+    화면 표시에는 float32 정밀도(유효숫자 약 7자리)로 충분하다.
+    """
+    return np.asarray(values, dtype=np.float32)
+
+
+# ==================== 등온선 ====================
+
+def _isotherm_lines(T_values, V_iso: np.ndarray, P_min: float = 0.5,
+                    P_max: float = 10.5) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    여러 온도의 등온선을 NaN으로 구분한 하나의 (V, P) 선으로 만든다.
+    온도마다 선을 따로 그리는 대신 트레이스/아티스트 하나로 그릴 수 있다.
+
+    Returns:
+        (V 좌표, P 좌표, 라벨 (T, V, P) 배열) - 라벨은 화면 안에서 끝나는 등온선의 마지막 점
+    """
+    T = np.asarray(T_values, dtype=float)
+    P_mat = (n * R * T[:, None]) / V_iso[None, :]
+    mask = (P_mat >= P_min) & (P_mat <= P_max)
+
+    # 범위 안의 점만 남기고, 행 끝마다 NaN 하나를 넣어 등온선끼리 이어지지 않게 한다
+    P_lines = np.full((len(T), len(V_iso) + 1), np.nan)
+    P_lines[:, :-1] = P_mat
+    V_lines = np.full_like(P_lines, np.nan)
+    V_lines[:, :-1] = V_iso
+    keep = np.ones(P_lines.shape, dtype=bool)
+    keep[:, :-1] = mask
+
+    last = len(V_iso) - 1 - np.argmax(mask[:, ::-1], axis=1)
+    labeled = mask.any(axis=1) & (last < len(V_iso) - 1)
+    rows = np.flatnonzero(labeled)
+    labels = np.stack([T[rows], V_iso[last[rows]], P_mat[rows, last[rows]]], axis=1)
+    return V_lines[keep], P_lines[keep], labels
+
+
+# ==================== 경로 열(column) 추출 ====================
+
+def _path_columns(paths: List[Dict], optimal_path: Optional[Dict], key: str) -> Tuple[List[str], np.ndarray, np.ndarray]:
+    """
+    경로 레코드 목록에서 한 물리량을 열 배열로 뽑는다 (AoS → SoA).
+    최적 경로가 있으면 마지막 원소로 붙인다.
+
+    Returns:
+        (막대 이름 목록, 값 배열, 최적 경로 여부 마스크)
+    """
+    names = [f"경로 {i+1}\n({path.get('type', '일반')})"
+             for i, path in enumerate(paths) if key in path]
+    values = [path[key] for path in paths if key in path]
+    if optimal_path and key in optimal_path:
+        names.append("⭐ 최적 경로")
+        values.append(optimal_path[key])
+    is_optimal = np.zeros(len(values), dtype=bool)
+    if optimal_path and key in optimal_path:
+        is_optimal[-1] = True
+    return names, np.asarray(values, dtype=float), is_optimal
+
+
+# ==================== Matplotlib 지연 로드 / 한글 폰트 설정 ====================
+# pyplot은 import에만 수백 ms가 걸리고 앱은 Plotly 그래프만 쓰므로,
+# Matplotlib 기반 함수가 처음 호출될 때 불러와 설정한다.
+
+@lru_cache(maxsize=1)
+def _pyplot():
+    """pyplot 모듈 반환 (처음 호출 시 백엔드와 한글 폰트 설정)"""
+    # matplotlib 백엔드 설정 (GUI 없는 환경용)
+    import matplotlib
+    if os.environ.get('DISPLAY') is None:
+        matplotlib.use('Agg')
+
+    import matplotlib.pyplot as plt
+    _apply_font(plt)
+    return plt
+
 
 def get_korean_font():
     """시스템에 맞는 한글 폰트 이름 반환"""
@@ -36,6 +147,7 @@ def get_korean_font():
     else:
         font_candidates = ['NanumGothic', 'NanumBarunGothic', 'UnDotum', 'DejaVu Sans']
 
+    import matplotlib.font_manager as fm
     available_fonts = [f.name for f in fm.fontManager.ttflist]
 
     for font in font_candidates:
@@ -43,17 +155,41 @@ def get_korean_font():
             return font
     return 'sans-serif'
 
-# 폰트 이름 저장
-KOREAN_FONT = get_korean_font()
+# 폰트 이름 저장 (폰트 목록 검색은 한 번만)
+_korean_font = lru_cache(maxsize=1)(get_korean_font)
+
+
+def _apply_font(plt):
+    font = _korean_font()
+    plt.rcParams['font.family'] = font
+    plt.rcParams['font.sans-serif'] = [font, 'DejaVu Sans', 'Arial']
+    plt.rcParams['axes.unicode_minus'] = False
+
 
 def apply_korean_font():
     """매번 그래프 생성 전 호출하여 한글 폰트 적용"""
-    plt.rcParams['font.family'] = KOREAN_FONT
-    plt.rcParams['font.sans-serif'] = [KOREAN_FONT, 'DejaVu Sans', 'Arial']
-    plt.rcParams['axes.unicode_minus'] = False
+    _apply_font(_pyplot())
 
-# 초기 폰트 설정 적용
-apply_korean_font()
+
+@lru_cache(maxsize=2)
+def _style_rc(dark_mode: bool) -> Dict:
+    """
+    다크/라이트 모드 rcParams (스타일 + 한글 폰트, 모드별로 한 번만 만든다).
+    plt.style.use와 달리 rc_context로 그림을 만드는 동안만 적용되어 전역 설정을 바꾸지 않는다.
+    """
+    plt = _pyplot()
+    from matplotlib.style.core import STYLE_BLACKLIST
+
+    # plt.style.use('default')처럼 기본값에서 시작 (backend 등 스타일과 무관한 키는 제외)
+    rc = {key: value for key, value in plt.rcParamsDefault.items()
+          if key not in STYLE_BLACKLIST}
+    if dark_mode:
+        rc.update(plt.style.library['dark_background'])
+    font = _korean_font()
+    rc['font.family'] = font
+    rc['font.sans-serif'] = [font, 'DejaVu Sans', 'Arial']
+    rc['axes.unicode_minus'] = False
+    return rc
 
 
 # ==================== Matplotlib 기반 시각화 ====================
@@ -63,132 +199,98 @@ def plot_pv_diagram(paths: List[Dict], optimal_path: Optional[Dict] = None,
                    show_isotherms: bool = True, figsize: Tuple = (10, 8),
                    dark_mode: bool = False) -> Tuple:
     """P-V 다이어그램 그리기 (Matplotlib)"""
+    plt = _pyplot()
 
-    # 다크모드 설정
+    # 다크모드 색상 (스타일은 아래 rc_context로 그리는 동안만 적용)
     if dark_mode:
-        plt.style.use('dark_background')
         bg_color = '#1e1e1e'
         text_color = 'white'
         grid_color = 'gray'
     else:
-        plt.style.use('default')
         bg_color = 'white'
         text_color = 'black'
         grid_color = 'lightgray'
 
-    # 스타일 적용 후 폰트 재설정
-    apply_korean_font()
-
-    fig, ax = plt.subplots(figsize=figsize)
-    fig.patch.set_facecolor(bg_color)
-    ax.set_facecolor(bg_color)
+    with plt.rc_context(_style_rc(dark_mode)):
+        fig, ax = plt.subplots(figsize=figsize)
+        fig.patch.set_facecolor(bg_color)
+        ax.set_facecolor(bg_color)
 
-    # 등온선 표시
-    if show_isotherms:
-        T_values = [200, 300, 400, 500, 600, 700, 800]
-        V_iso = np.linspace(0.5, 10.5, 200)
-        for T in T_values:
-            P_iso = (n * R * T) / V_iso
-            mask = (P_iso >= 0.5) & (P_iso <= 10.5)
-            ax.plot(V_iso[mask], P_iso[mask], color=grid_color, alpha=0.3,
+        # 등온선 표시
+        if show_isotherms:
+            T_values = [200, 300, 400, 500, 600, 700, 800]
+            V_lines, P_lines, labels = _isotherm_lines(T_values, np.linspace(0.5, 10.5, 200))
+            ax.plot(V_lines, P_lines, color=grid_color, alpha=0.3,
                    linestyle='--', linewidth=0.8)
             # 온도 라벨
-            if np.any(mask):
-                idx = np.where(mask)[0][-1]
-                if idx < len(V_iso) - 1:
-                    ax.text(V_iso[idx], P_iso[idx], f'{T}K',
-                           fontsize=8, color=grid_color, alpha=0.6)
-
-    # 초기/최종 상태 점 표시
-    ax.scatter([V1], [P1], s=300, c='#00ff88', marker='o',
-              label='A (시작)', zorder=5, edgecolors='white', linewidths=2)
-    ax.scatter([V2], [P2], s=300, c='#ff4444', marker='s',
-              label='B (끝)', zorder=5, edgecolors='white', linewidths=2)
-
-    # 온도 표시
-    T1 = calculate_temperature(P1, V1)
-    T2 = calculate_temperature(P2, V2)
-    ax.text(V1, P1 + 0.4, f'T={T1:.0f}K', fontsize=11,
-           ha='center', color='#00ff88', weight='bold')
-    ax.text(V2, P2 + 0.4, f'T={T2:.0f}K', fontsize=11,
-           ha='center', color='#ff4444', weight='bold')
-
-    # 일반 경로들 표시
-    colors = ['#3498db', '#e67e22', '#9b59b6', '#1abc9c', '#e91e63', '#00bcd4']
-    for i, path in enumerate(paths):
-        if 'P_array' in path and 'V_array' in path:
-            color = colors[i % len(colors)]
-            ax.plot(path['V_array'], path['P_array'], color=color,
-                   linewidth=2.5, label=f"경로 {i+1}: {path.get('type', '일반')}",
-                   alpha=0.85, zorder=3)
-            # 방향 화살표
-            mid = len(path['V_array']) // 2
-            if mid > 0:
-                ax.annotate('', xy=(path['V_array'][mid+1], path['P_array'][mid+1]),
-                           xytext=(path['V_array'][mid], path['P_array'][mid]),
-                           arrowprops=dict(arrowstyle='->', color=color, lw=2))
-
-    # 최적 경로 표시
-    if optimal_path and 'P_array' in optimal_path and 'V_array' in optimal_path:
-        ax.plot(optimal_path['V_array'], optimal_path['P_array'],
-               color='#ff0066', linewidth=4, label='⭐ 최적 경로',
-               zorder=4, alpha=0.95)
-        # 영역 채우기 (일 시각화)
-        ax.fill_between(optimal_path['V_array'], optimal_path['P_array'],
-                        alpha=0.15, color='#ff0066')
-
-    # 축 설정
-    ax.set_xlabel("부피 V (L)", fontsize=14, weight='bold', color=text_color)
-    ax.set_ylabel("압력 P (atm)", fontsize=14, weight='bold', color=text_color)
-    ax.set_xlim(0.5, 10.5)
-    ax.set_ylim(0.5, 10.5)
-    ax.legend(fontsize=10, loc='best', framealpha=0.9)
-    ax.grid(True, alpha=0.3, linestyle='--', color=grid_color)
-    ax.set_title("P-V 다이어그램", fontsize=16, weight='bold', pad=15, color=text_color)
-    ax.tick_params(colors=text_color)
-
-    plt.tight_layout()
-    return fig, ax
-
-
-def plot_work_comparison(paths: List[Dict], optimal_path: Optional[Dict] = None,
-                        W_reversible: Optional[float] = None,
-                        figsize: Tuple = (10, 5), dark_mode: bool = False) -> Tuple:
-    """경로별 일 비교 막대 그래프"""
-
-    if dark_mode:
-        plt.style.use('dark_background')
-        bg_color = '#1e1e1e'
-    else:
-        plt.style.use('default')
-        bg_color = 'white'
-
-    # 스타일 적용 후 폰트 재설정
-    apply_korean_font()
-
-    fig, ax = plt.subplots(figsize=figsize)
-    fig.patch.set_facecolor(bg_color)
-    ax.set_facecolor(bg_color)
-
-    names = []
-    works = []
-    colors_list = []
+            for T, V_label, P_label in labels:
+                ax.text(V_label, P_label, f'{T:.0f}K',
+                       fontsize=8, color=grid_color, alpha=0.6)
+
+        # 초기/최종 상태 점 표시
+        ax.scatter([V1], [P1], s=300, c='#00ff88', marker='o',
+                  label='A (시작)', zorder=5, edgecolors='white', linewidths=2)
+        ax.scatter([V2], [P2], s=300, c='#ff4444', marker='s',
+                  label='B (끝)', zorder=5, edgecolors='white', linewidths=2)
+
+        # 온도 표시
+        T1 = calculate_temperature(P1, V1)
+        T2 = calculate_temperature(P2, V2)
+        ax.text(V1, P1 + 0.4, f'T={T1:.0f}K', fontsize=11,
+               ha='center', color='#00ff88', weight='bold')
+        ax.text(V2, P2 + 0.4, f'T={T2:.0f}K', fontsize=11,
+               ha='center', color='#ff4444', weight='bold')
+
+        # 일반 경로들 표시
+        colors = ['#3498db', '#e67e22', '#9b59b6', '#1abc9c', '#e91e63', '#00bcd4']
+        for i, path in enumerate(paths):
+            if 'P_array' in path and 'V_array' in path:
+                color = colors[i % len(colors)]
+                P_plot, V_plot = _downsample_path(path['P_array'], path['V_array'])
+                ax.plot(V_plot, P_plot, color=color,
+                       linewidth=2.5, label=f"경로 {i+1}: {path.get('type', '일반')}",
+                       alpha=0.85, zorder=3)
+                # 방향 화살표
+                mid = len(V_plot) // 2
+                if mid > 0:
+                    ax.annotate('', xy=(V_plot[mid+1], P_plot[mid+1]),
+                               xytext=(V_plot[mid], P_plot[mid]),
+                               arrowprops=dict(arrowstyle='->', color=color, lw=2))
+
+        # 최적 경로 표시
+        if optimal_path and 'P_array' in optimal_path and 'V_array' in optimal_path:
+            P_opt, V_opt = _downsample_path(optimal_path['P_array'], optimal_path['V_array'])
+            ax.plot(V_opt, P_opt,
+                   color='#ff0066', linewidth=4, label='⭐ 최적 경로',
+                   zorder=4, alpha=0.95)
+            # 영역 채우기 (일 시각화)
+            ax.fill_between(V_opt, P_opt,
+                            alpha=0.15, color='#ff0066')
+
+        # 축 설정
+        ax.set_xlabel("부피 V (L)", fontsize=14, weight='bold', color=text_color)
+        ax.set_ylabel("압력 P (atm)", fontsize=14, weight='bold', color=text_color)
+        ax.set_xlim(0.5, 10.5)
+        ax.set_ylim(0.5, 10.5)
+        ax.legend(fontsize=10, loc='best', framealpha=0.9)
+        ax.grid(True, alpha=0.3, linestyle='--', color=grid_color)
+        ax.set_title("P-V 다이어그램", fontsize=16, weight='bold', pad=15, color=text_color)
+        ax.tick_params(colors=text_color)
+
+        plt.tight_layout()
+        return fig, ax
 
-    for i, path in enumerate(paths):
-        if 'W' in path:
-            names.append(f"경로 {i+1}\n({path.get('type', '일반')})")
-            works.append(path['W'])
-            colors_list.append('#3498db')
 
-    if optimal_path and 'W' in optimal_path:
-        names.append("⭐ 최적 경로")
-        works.append(optimal_path['W'])
-        colors_list.append('#ff0066')
+def _draw_work_bars(ax, paths: List[Dict], optimal_path: Optional[Dict],
+                    W_reversible: Optional[float]) -> bool:
+    """ax에 경로별 일 막대를 그린다 (경로가 없으면 안내 문구만 쓰고 False 반환)"""
+    names, works, is_optimal = _path_columns(paths, optimal_path, 'W')
+    colors_list = np.where(is_optimal, '#ff0066', '#3498db')
 
     if len(works) == 0:
         ax.text(0.5, 0.5, '경로를 추가해주세요',
                ha='center', va='center', transform=ax.transAxes, fontsize=14)
-        return fig, ax
+        return False
 
     bars = ax.bar(names, works, color=colors_list, alpha=0.85,
                   edgecolor='white', linewidth=1.5)
@@ -198,82 +300,301 @@ def plot_work_comparison(paths: List[Dict], optimal_path: Optional[Dict] = None,
                   linewidth=2.5, label=f'가역 과정 ({W_reversible:.2f} L·atm)')
         ax.legend(fontsize=11)
 
-    for bar, work in zip(bars, works):
-        height = bar.get_height()
-        ax.text(bar.get_x() + bar.get_width()/2., height,
-               f'{work:.2f}', ha='center', va='bottom', fontsize=11, weight='bold')
+    ax.bar_label(bars, labels=[f'{w:.2f}' for w in works],
+                 fontsize=11, weight='bold')
 
     ax.set_ylabel("일 W (L·atm)", fontsize=13, weight='bold')
     ax.set_title("경로별 한 일 비교", fontsize=15, weight='bold', pad=15)
     ax.grid(axis='y', alpha=0.3, linestyle='--')
-    plt.xticks(rotation=45, ha='right')
-    plt.tight_layout()
+    _pyplot().setp(ax.get_xticklabels(), rotation=45, ha='right')
+    return True
 
-    return fig, ax
+
+def _draw_efficiency_bars(ax, paths: List[Dict], optimal_path: Optional[Dict]) -> bool:
+    """ax에 경로별 효율 막대를 그린다 (경로가 없으면 안내 문구만 쓰고 False 반환)"""
+    names, efficiencies, is_optimal = _path_columns(paths, optimal_path, 'efficiency')
+    colors_list = np.where(is_optimal, '#ff0066', '#3498db')
+
+    if len(efficiencies) == 0:
+        ax.text(0.5, 0.5, '경로를 추가해주세요',
+               ha='center', va='center', transform=ax.transAxes, fontsize=14)
+        return False
+
+    bars = ax.bar(names, efficiencies, color=colors_list, alpha=0.85,
+                  edgecolor='white', linewidth=1.5)
+
+    ax.axhline(y=100, color='#00ff88', linestyle='--', linewidth=2,
+              label='100% (가역 과정)')
+    ax.legend(fontsize=11)
+
+    ax.bar_label(bars, labels=[f'{e:.1f}%' for e in efficiencies],
+                 fontsize=11, weight='bold')
+
+    ax.set_ylabel("효율 (%)", fontsize=13, weight='bold')
+    ax.set_title("경로별 효율 비교", fontsize=15, weight='bold', pad=15)
+    ax.set_ylim(0, max(110, efficiencies.max() * 1.1))
+    ax.grid(axis='y', alpha=0.3, linestyle='--')
+    _pyplot().setp(ax.get_xticklabels(), rotation=45, ha='right')
+    return True
+
+
+def plot_work_comparison(paths: List[Dict], optimal_path: Optional[Dict] = None,
+                        W_reversible: Optional[float] = None,
+                        figsize: Tuple = (10, 5), dark_mode: bool = False) -> Tuple:
+    """경로별 일 비교 막대 그래프"""
+    plt = _pyplot()
+    bg_color = '#1e1e1e' if dark_mode else 'white'
+
+    with plt.rc_context(_style_rc(dark_mode)):
+        fig, ax = plt.subplots(figsize=figsize)
+        fig.patch.set_facecolor(bg_color)
+        ax.set_facecolor(bg_color)
+
+        if _draw_work_bars(ax, paths, optimal_path, W_reversible):
+            plt.tight_layout()
+        return fig, ax
 
 
 def plot_efficiency_comparison(paths: List[Dict], optimal_path: Optional[Dict] = None,
                               figsize: Tuple = (10, 5), dark_mode: bool = False) -> Tuple:
     """경로별 효율 비교 막대 그래프"""
+    plt = _pyplot()
+    bg_color = '#1e1e1e' if dark_mode else 'white'
+
+    with plt.rc_context(_style_rc(dark_mode)):
+        fig, ax = plt.subplots(figsize=figsize)
+        fig.patch.set_facecolor(bg_color)
+        ax.set_facecolor(bg_color)
+
+        if _draw_efficiency_bars(ax, paths, optimal_path):
+            plt.tight_layout()
+        return fig, ax
+
+
+def plot_comparisons(paths: List[Dict], optimal_path: Optional[Dict] = None,
+                     W_reversible: Optional[float] = None,
+                     figsize: Tuple = (20, 5), dark_mode: bool = False) -> Tuple:
+    """
+    일 비교와 효율 비교를 한 Figure의 1×2 서브플롯으로 그린다.
+    두 그래프를 함께 보여줄 때 Figure를 두 번 만들고 레이아웃을 두 번 계산하지 않는다.
+
+    Returns:
+        (fig, (일 비교 ax, 효율 비교 ax))
+    """
+    plt = _pyplot()
+    bg_color = '#1e1e1e' if dark_mode else 'white'
+
+    with plt.rc_context(_style_rc(dark_mode)):
+        fig, (ax_work, ax_eff) = plt.subplots(1, 2, figsize=figsize)
+        fig.patch.set_facecolor(bg_color)
+        ax_work.set_facecolor(bg_color)
+        ax_eff.set_facecolor(bg_color)
+
+        drawn_work = _draw_work_bars(ax_work, paths, optimal_path, W_reversible)
+        drawn_eff = _draw_efficiency_bars(ax_eff, paths, optimal_path)
+        if drawn_work or drawn_eff:
+            plt.tight_layout()
+        return fig, (ax_work, ax_eff)
+
+
+# ==================== Plotly 기반 2D 시각화 ====================
+
+def plot_pv_diagram_plotly(paths: List[Dict], optimal_path: Optional[Dict] = None,
+                           P1: float = 5, V1: float = 2, P2: float = 1, V2: float = 8,
+                           show_isotherms: bool = True, dark_mode: bool = True) -> go.Figure:
+    """P-V 다이어그램 (Plotly, 브라우저에서 렌더링)"""
 
     if dark_mode:
-        plt.style.use('dark_background')
+        template = 'plotly_dark'
         bg_color = '#1e1e1e'
+        grid_color = 'gray'
     else:
-        plt.style.use('default')
+        template = 'plotly_white'
         bg_color = 'white'
+        grid_color = 'lightgray'
 
-    # 스타일 적용 후 폰트 재설정
-    apply_korean_font()
-
-    fig, ax = plt.subplots(figsize=figsize)
-    fig.patch.set_facecolor(bg_color)
-    ax.set_facecolor(bg_color)
+    fig = go.Figure()
 
-    names = []
-    efficiencies = []
-    colors_list = []
+    # 등온선 표시
+    if show_isotherms:
+        V_lines, P_lines, labels = _isotherm_lines([200, 300, 400, 500, 600, 700, 800],
+                                                   np.linspace(0.5, 10.5, 200))
+        fig.add_trace(go.Scatter(
+            x=V_lines, y=P_lines,
+            mode='lines',
+            line=dict(color=grid_color, width=0.8, dash='dash'),
+            opacity=0.4,
+            connectgaps=False,
+            hoverinfo='skip',
+            showlegend=False
+        ))
+        for T, V_label, P_label in labels:
+            fig.add_annotation(x=V_label, y=P_label, text=f'{T:.0f}K',
+                               showarrow=False, font=dict(size=9, color=grid_color))
 
+    # 일반 경로들 표시
+    colors = ['#3498db', '#e67e22', '#9b59b6', '#1abc9c', '#e91e63', '#00bcd4']
     for i, path in enumerate(paths):
-        if 'efficiency' in path:
-            names.append(f"경로 {i+1}\n({path.get('type', '일반')})")
-            efficiencies.append(path['efficiency'])
-            colors_list.append('#3498db')
+        if 'P_array' in path and 'V_array' in path:
+            color = colors[i % len(colors)]
+            P_plot, V_plot = _downsample_path(path['P_array'], path['V_array'])
+            fig.add_trace(go.Scatter(
+                x=V_plot, y=P_plot,
+                mode='lines',
+                line=dict(color=color, width=3),
+                name=f"경로 {i+1}: {path.get('type', '일반')}"
+            ))
+            # 방향 화살표
+            mid = len(V_plot) // 2
+            if mid > 0:
+                fig.add_annotation(x=V_plot[mid+1], y=P_plot[mid+1],
+                                   ax=V_plot[mid], ay=P_plot[mid],
+                                   xref='x', yref='y', axref='x', ayref='y',
+                                   showarrow=True, arrowhead=2, arrowwidth=2,
+                                   arrowcolor=color, text='')
 
-    if optimal_path and 'efficiency' in optimal_path:
-        names.append("⭐ 최적 경로")
-        efficiencies.append(optimal_path['efficiency'])
-        colors_list.append('#ff0066')
+    # 최적 경로 표시 (곡선 아래 면적 = 일)
+    if optimal_path and 'P_array' in optimal_path and 'V_array' in optimal_path:
+        P_opt, V_opt = _downsample_path(optimal_path['P_array'], optimal_path['V_array'])
+        fig.add_trace(go.Scatter(
+            x=V_opt, y=P_opt,
+            mode='lines',
+            line=dict(color='#ff0066', width=5),
+            fill='tozeroy',
+            fillcolor='rgba(255, 0, 102, 0.15)',
+            name='⭐ 최적 경로'
+        ))
 
-    if len(efficiencies) == 0:
-        ax.text(0.5, 0.5, '경로를 추가해주세요',
-               ha='center', va='center', transform=ax.transAxes, fontsize=14)
-        return fig, ax
+    # 초기/최종 상태 점 표시
+    T1 = calculate_temperature(P1, V1)
+    T2 = calculate_temperature(P2, V2)
+    fig.add_trace(go.Scatter(
+        x=[V1], y=[P1],
+        mode='markers+text',
+        marker=dict(size=16, color='#00ff88', symbol='circle', line=dict(width=2, color='white')),
+        text=[f'T={T1:.0f}K'],
+        textposition='top center',
+        textfont=dict(color='#00ff88', size=12),
+        name='A (시작)'
+    ))
+    fig.add_trace(go.Scatter(
+        x=[V2], y=[P2],
+        mode='markers+text',
+        marker=dict(size=16, color='#ff4444', symbol='square', line=dict(width=2, color='white')),
+        text=[f'T={T2:.0f}K'],
+        textposition='top center',
+        textfont=dict(color='#ff4444', size=12),
+        name='B (끝)'
+    ))
 
-    bars = ax.bar(names, efficiencies, color=colors_list, alpha=0.85,
-                  edgecolor='white', linewidth=1.5)
+    fig.update_layout(
+        template=template,
+        title='P-V 다이어그램',
+        paper_bgcolor=bg_color,
+        plot_bgcolor=bg_color,
+        height=600,
+        xaxis=dict(title='부피 V (L)', range=[0.5, 10.5]),
+        yaxis=dict(title='압력 P (atm)', range=[0.5, 10.5])
+    )
 
-    ax.axhline(y=100, color='#00ff88', linestyle='--', linewidth=2,
-              label='100% (가역 과정)')
-    ax.legend(fontsize=11)
+    return fig
 
-    for bar, eff in zip(bars, efficiencies):
-        height = bar.get_height()
-        ax.text(bar.get_x() + bar.get_width()/2., height,
-               f'{eff:.1f}%', ha='center', va='bottom', fontsize=11, weight='bold')
 
-    ax.set_ylabel("효율 (%)", fontsize=13, weight='bold')
-    ax.set_title("경로별 효율 비교", fontsize=15, weight='bold', pad=15)
-    ax.set_ylim(0, max(110, max(efficiencies) * 1.1) if efficiencies else 110)
-    ax.grid(axis='y', alpha=0.3, linestyle='--')
-    plt.xticks(rotation=45, ha='right')
-    plt.tight_layout()
+def _plot_path_bars(names: List[str], values: np.ndarray, is_optimal: np.ndarray,
+                    labels: List[str], title: str, y_title: str,
+                    dark_mode: bool) -> go.Figure:
+    """경로별 막대 그래프 공통 부분 (최적 경로는 강조 색)"""
 
-    return fig, ax
+    if dark_mode:
+        template = 'plotly_dark'
+        bg_color = '#1e1e1e'
+    else:
+        template = 'plotly_white'
+        bg_color = 'white'
+
+    fig = go.Figure()
+
+    if len(values) == 0:
+        fig.add_annotation(text='경로를 추가해주세요', x=0.5, y=0.5,
+                           xref='paper', yref='paper', showarrow=False, font=dict(size=14))
+    else:
+        fig.add_trace(go.Bar(
+            x=[name.replace('\n', '<br>') for name in names],
+            y=values,
+            marker_color=np.where(is_optimal, '#ff0066', '#3498db'),
+            text=labels,
+            textposition='outside',
+            opacity=0.85
+        ))
+
+    fig.update_layout(
+        template=template,
+        title=title,
+        yaxis_title=y_title,
+        paper_bgcolor=bg_color,
+        plot_bgcolor=bg_color,
+        showlegend=False
+    )
+
+    return fig
+
+
+def plot_work_comparison_plotly(paths: List[Dict], optimal_path: Optional[Dict] = None,
+                                W_reversible: Optional[float] = None,
+                                dark_mode: bool = True) -> go.Figure:
+    """경로별 일 비교 막대 그래프 (Plotly)"""
+    names, works, is_optimal = _path_columns(paths, optimal_path, 'W')
+    fig = _plot_path_bars(names, works, is_optimal, [f'{w:.2f}' for w in works],
+                          '경로별 한 일 비교', '일 W (L·atm)', dark_mode)
+
+    if W_reversible is not None and len(works) > 0:
+        fig.add_hline(y=W_reversible, line=dict(color='#00ff88', dash='dash', width=2.5),
+                      annotation_text=f'가역 과정 ({W_reversible:.2f} L·atm)')
+
+    return fig
+
+
+def plot_efficiency_comparison_plotly(paths: List[Dict], optimal_path: Optional[Dict] = None,
+                                      dark_mode: bool = True) -> go.Figure:
+    """경로별 효율 비교 막대 그래프 (Plotly)"""
+    names, efficiencies, is_optimal = _path_columns(paths, optimal_path, 'efficiency')
+    fig = _plot_path_bars(names, efficiencies, is_optimal, [f'{e:.1f}%' for e in efficiencies],
+                          '경로별 효율 비교', '효율 (%)', dark_mode)
+
+    if len(efficiencies) > 0:
+        fig.add_hline(y=100, line=dict(color='#00ff88', dash='dash', width=2),
+                      annotation_text='100% (가역 과정)')
+        fig.update_yaxes(range=[0, max(110, efficiencies.max() * 1.1)])
+
+    return fig
 
 
 # ==================== Plotly 기반 3D 시각화 ====================
 
+@lru_cache(maxsize=1)
+def _state_surface_trace() -> go.Surface:
+    """
+    PV=nRT 표면 트레이스 (상태점과 무관하므로 격자와 트레이스 검증을 한 번만 수행).
+    add_trace는 트레이스를 복사해 넣으므로 캐시된 객체를 여러 그림에서 공유해도 된다.
+    """
+    # 단조 쌍곡면이라 20×20이면 충분히 매끄럽다
+    V_surf = np.linspace(1, 10, 20)
+    T_surf = np.linspace(200, 800, 20)
+    V_mesh, T_mesh = np.meshgrid(V_surf, T_surf)
+    P_mesh = (n * R * T_mesh) / V_mesh
+    return go.Surface(
+        x=_trace_array(V_mesh), y=_trace_array(T_mesh), z=_trace_array(P_mesh),
+        colorscale='Viridis',
+        opacity=0.4,
+        showscale=False,
+        hoverinfo='skip',
+        # 호버 시 등고선 하이라이트도 계산하지 않는다
+        contours=dict(x=dict(highlight=False), y=dict(highlight=False), z=dict(highlight=False)),
+        lighting=dict(specular=0),
+        name='상태방정식 표면'
+    )
+
+
 def plot_3d_pvt_diagram(paths: List[Dict], optimal_path: Optional[Dict] = None,
                        P1: float = 5, V1: float = 2, P2: float = 1, V2: float = 8,
                        show_surface: bool = True, dark_mode: bool = True) -> go.Figure:
@@ -293,67 +614,59 @@ def plot_3d_pvt_diagram(paths: List[Dict], optimal_path: Optional[Dict] = None,
 
     # 이상기체 상태방정식 표면
     if show_surface:
-        V_surf = np.linspace(1, 10, 30)
-        T_surf = np.linspace(200, 800, 30)
-        V_mesh, T_mesh = np.meshgrid(V_surf, T_surf)
-        P_mesh = (n * R * T_mesh) / V_mesh
-
-        fig.add_trace(go.Surface(
-            x=V_mesh, y=T_mesh, z=P_mesh,
-            colorscale='Viridis',
-            opacity=0.4,
-            showscale=False,
-            name='상태방정식 표면'
-        ))
+        fig.add_trace(_state_surface_trace())
 
     # 초기/최종 상태점
     T1 = calculate_temperature(P1, V1)
     T2 = calculate_temperature(P2, V2)
 
     fig.add_trace(go.Scatter3d(
-        x=[V1], y=[T1], z=[P1],
+        x=[V1, V2], y=[T1, T2], z=[P1, P2],
         mode='markers+text',
-        marker=dict(size=12, color='#00ff88', symbol='circle'),
-        text=['A (시작)'],
+        marker=dict(size=12, color=['#00ff88', '#ff4444'], symbol=['circle', 'square']),
+        text=['A (시작)', 'B (끝)'],
         textposition='top center',
-        name='초기 상태 A'
+        name='상태 A → B'
     ))
 
-    fig.add_trace(go.Scatter3d(
-        x=[V2], y=[T2], z=[P2],
-        mode='markers+text',
-        marker=dict(size=12, color='#ff4444', symbol='square'),
-        text=['B (끝)'],
-        textposition='top center',
-        name='최종 상태 B'
-    ))
-
-    # 일반 경로들
+    # 일반 경로들 (같은 타입의 경로는 범례 항목 하나로 묶는다)
+    # 범례 항목 이름은 타입과 묶인 경로 번호, 경로별 이름은 호버에만 표시한다
     colors = ['#3498db', '#e67e22', '#9b59b6', '#1abc9c', '#e91e63']
-    for i, path in enumerate(paths):
-        if 'P_array' in path and 'V_array' in path:
-            T_array = np.array([calculate_temperature(p, v)
-                               for p, v in zip(path['P_array'], path['V_array'])])
-            color = colors[i % len(colors)]
+    plotted = [(i, path, path.get('type') or '일반') for i, path in enumerate(paths)
+               if 'P_array' in path and 'V_array' in path]
+    group_members = {}
+    for i, _, path_type in plotted:
+        group_members.setdefault(path_type, []).append(str(i + 1))
+
+    seen_types = set()
+    for i, path, path_type in plotted:
+        P_plot, V_plot = _downsample_path(path['P_array'], path['V_array'])
+        T_array = calculate_temperature(P_plot, V_plot)
+        color = colors[i % len(colors)]
 
-            fig.add_trace(go.Scatter3d(
-                x=path['V_array'],
-                y=T_array,
-                z=path['P_array'],
-                mode='lines',
-                line=dict(color=color, width=6),
-                name=f"경로 {i+1}: {path.get('type', '일반')}"
-            ))
+        fig.add_trace(go.Scatter3d(
+            x=_trace_array(V_plot),
+            y=_trace_array(T_array),
+            z=_trace_array(P_plot),
+            mode='lines',
+            line=dict(color=color, width=6),
+            name=f"{path_type} (경로 {', '.join(group_members[path_type])})",
+            hovertemplate=('V=%{x:.2f} L<br>T=%{y:.1f} K<br>P=%{z:.2f} atm'
+                           f'<extra>경로 {i+1}: {path_type}</extra>'),
+            legendgroup=path_type,
+            showlegend=path_type not in seen_types
+        ))
+        seen_types.add(path_type)
 
     # 최적 경로
     if optimal_path and 'P_array' in optimal_path and 'V_array' in optimal_path:
-        T_opt = np.array([calculate_temperature(p, v)
-                        for p, v in zip(optimal_path['P_array'], optimal_path['V_array'])])
+        P_opt, V_opt = _downsample_path(optimal_path['P_array'], optimal_path['V_array'])
+        T_opt = calculate_temperature(P_opt, V_opt)
 
         fig.add_trace(go.Scatter3d(
-            x=optimal_path['V_array'],
-            y=T_opt,
-            z=optimal_path['P_array'],
+            x=_trace_array(V_opt),
+            y=_trace_array(T_opt),
+            z=_trace_array(P_opt),
             mode='lines',
             line=dict(color='#ff0066', width=8),
             name='⭐ 최적 경로'
@@ -407,8 +720,8 @@ def plot_cycle_diagram(cycle_data: Dict, dark_mode: bool = True) -> go.Figure:
         color = colors[i % len(colors)]
         fig.add_trace(
             go.Scatter(
-                x=path['V'],
-                y=path['P'],
+                x=_trace_array(path['V']),
+                y=_trace_array(path['P']),
                 mode='lines',
                 name=f"{path.get('step', '')}: {path.get('type', '')}",
                 line=dict(color=color, width=3),
@@ -417,21 +730,20 @@ def plot_cycle_diagram(cycle_data: Dict, dark_mode: bool = True) -> go.Figure:
             row=1, col=1
         )
 
-    # 상태점 표시
-    states = cycle_data.get('states', {})
-    for state_name, state in states.items():
-        fig.add_trace(
-            go.Scatter(
-                x=[state['V']],
-                y=[state['P']],
-                mode='markers+text',
-                marker=dict(size=12, color='white', line=dict(width=2, color='black')),
-                text=[state_name],
-                textposition='top center',
-                showlegend=False
-            ),
-            row=1, col=1
-        )
+    # 상태점 표시 (모든 상태점을 트레이스 하나로)
+    states = cycle_data.get('states', {'names': [], 'P': [], 'V': []})
+    fig.add_trace(
+        go.Scatter(
+            x=states['V'],
+            y=states['P'],
+            mode='markers+text',
+            marker=dict(size=12, color='white', line=dict(width=2, color='black')),
+            text=states['names'],
+            textposition='top center',
+            showlegend=False
+        ),
+        row=1, col=1
+    )
 
     # 사이클 정보
     cycle_type = cycle_data.get('cycle_type', 'Unknown')
@@ -463,7 +775,13 @@ def plot_cycle_diagram(cycle_data: Dict, dark_mode: bool = True) -> go.Figure:
 
 def plot_animated_path(paths: List[Dict], P1: float, V1: float,
                       P2: float, V2: float, dark_mode: bool = True) -> go.Figure:
-    """경로 애니메이션 (Plotly)"""
+    """
+    경로 애니메이션 (Plotly)
+
+    프레임마다 트레이스를 새로 그리므로 SVG 대신 WebGL(Scattergl)로 렌더링한다.
+    프레임은 바뀌는 트레이스(진행 중인 경로, 현재 위치 마커)만 담고,
+    경로 하나당 최대 MAX_ANIMATION_FRAMES개로 제한한다.
+    """
 
     if dark_mode:
         template = 'plotly_dark'
@@ -474,22 +792,19 @@ def plot_animated_path(paths: List[Dict], P1: float, V1: float,
 
     fig = go.Figure()
 
-    # 등온선 배경
-    T_values = [300, 400, 500, 600, 700]
-    V_iso = np.linspace(0.5, 10.5, 100)
-    for T in T_values:
-        P_iso = (n * R * T) / V_iso
-        mask = (P_iso >= 0.5) & (P_iso <= 10.5)
-        fig.add_trace(go.Scatter(
-            x=V_iso[mask], y=P_iso[mask],
-            mode='lines',
-            line=dict(color='gray', width=1, dash='dash'),
-            opacity=0.3,
-            showlegend=False
-        ))
+    # 등온선 배경 (트레이스 0)
+    V_lines, P_lines, _ = _isotherm_lines([300, 400, 500, 600, 700], np.linspace(0.5, 10.5, 100))
+    fig.add_trace(go.Scattergl(
+        x=V_lines, y=P_lines,
+        mode='lines',
+        line=dict(color='gray', width=1, dash='dash'),
+        opacity=0.3,
+        connectgaps=False,
+        showlegend=False
+    ))
 
-    # 초기/최종 상태점
-    fig.add_trace(go.Scatter(
+    # 초기/최종 상태점 (트레이스 1, 2)
+    fig.add_trace(go.Scattergl(
         x=[V1], y=[P1],
         mode='markers+text',
         marker=dict(size=20, color='#00ff88'),
@@ -498,7 +813,7 @@ def plot_animated_path(paths: List[Dict], P1: float, V1: float,
         name='시작점 A'
     ))
 
-    fig.add_trace(go.Scatter(
+    fig.add_trace(go.Scattergl(
         x=[V2], y=[P2],
         mode='markers+text',
         marker=dict(size=20, color='#ff4444'),
@@ -507,55 +822,77 @@ def plot_animated_path(paths: List[Dict], P1: float, V1: float,
         name='끝점 B'
     ))
 
-    # 애니메이션 프레임 생성
-    frames = []
+    # 경로마다 빈 트레이스 하나와 현재 위치 마커 트레이스를 미리 만들어 두고,
+    # 프레임은 traces=[...]로 바뀌는 트레이스만 갱신한다 (이전 경로를 프레임마다 다시 보내지 않음)
     colors = ['#3498db', '#e67e22', '#9b59b6', '#ff0066']
+    # 경로 배열은 처음에 한 번만 다운샘플링해 float32 배열로 바꿔 두고 프레임에서는 슬라이스만 쓴다
+    animated = [(path_idx, path.get('type', '일반'))
+                + tuple(map(_trace_array, _downsample_path(path['P_array'], path['V_array'])))
+                for path_idx, path in enumerate(paths)
+                if 'P_array' in path and 'V_array' in path]
+    first_path_trace = len(fig.data)
+    for path_idx, path_type, _, _ in animated:
+        fig.add_trace(go.Scattergl(
+            x=[], y=[],
+            mode='lines',
+            line=dict(color=colors[path_idx % len(colors)], width=3),
+            name=f"경로 {path_idx+1}: {path_type}"
+        ))
+    marker_trace = len(fig.data)
+    fig.add_trace(go.Scattergl(
+        x=[], y=[],
+        mode='markers',
+        marker=dict(size=15, color='yellow', symbol='star'),
+        showlegend=False
+    ))
 
-    for path_idx, path in enumerate(paths):
-        if 'P_array' not in path or 'V_array' not in path:
-            continue
-
-        P_array = path['P_array']
-        V_array = path['V_array']
+    # 애니메이션 프레임 생성
+    frames = []
+    for k, (path_idx, _, P_array, V_array) in enumerate(animated):
         color = colors[path_idx % len(colors)]
-
-        for i in range(2, len(P_array) + 1):
-            frame_data = []
-
-            # 이전 경로들 (완성된 것)
-            for prev_idx in range(path_idx):
-                prev_path = paths[prev_idx]
-                if 'P_array' in prev_path and 'V_array' in prev_path:
-                    frame_data.append(go.Scatter(
-                        x=prev_path['V_array'],
-                        y=prev_path['P_array'],
-                        mode='lines',
-                        line=dict(color=colors[prev_idx % len(colors)], width=3),
-                        opacity=0.5
-                    ))
-
-            # 현재 경로 (진행 중)
-            frame_data.append(go.Scatter(
-                x=V_array[:i],
-                y=P_array[:i],
-                mode='lines+markers',
-                line=dict(color=color, width=4),
-                marker=dict(size=8, color=color)
-            ))
-
-            # 현재 위치 마커
-            frame_data.append(go.Scatter(
-                x=[V_array[i-1]],
-                y=[P_array[i-1]],
-                mode='markers',
-                marker=dict(size=15, color='yellow', symbol='star')
-            ))
-
-            frames.append(go.Frame(
+        current_trace = first_path_trace + k
+
+        # 프레임 수 제한 (마지막 점은 항상 포함)
+        frame_step = max(1, -(-len(P_array) // MAX_ANIMATION_FRAMES))
+        steps = list(range(2, len(P_array) + 1, frame_step))
+        if steps and steps[-1] != len(P_array):
+            steps.append(len(P_array))
+
+        for step_idx, i in enumerate(steps):
+            # 현재 경로 (진행 중) + 현재 위치 마커
+            frame_data = [
+                dict(type='scattergl', x=V_array[:i], y=P_array[:i]),
+                dict(type='scattergl', x=[V_array[i-1]], y=[P_array[i-1]]),
+            ]
+            frame_traces = [current_trace, marker_trace]
+
+            # 경로의 첫 프레임에서만 모든 경로 트레이스의 상태를 맞춘다
+            # (이전 경로는 완성된 모양, 이후 경로는 비움 - 슬라이더로 되돌아갈 때도 맞도록)
+            if step_idx == 0:
+                frame_data[0].update(mode='lines+markers', line=dict(color=color, width=4),
+                                     marker=dict(size=8, color=color), opacity=1)
+                for other, (other_idx, _, P_other, V_other) in enumerate(animated):
+                    if other == k:
+                        continue
+                    if other < k:
+                        frame_data.append(dict(
+                            type='scattergl',
+                            x=V_other, y=P_other,
+                            mode='lines',
+                            line=dict(color=colors[other_idx % len(colors)], width=3),
+                            opacity=0.5
+                        ))
+                    else:
+                        frame_data.append(dict(type='scattergl', x=[], y=[]))
+                    frame_traces.append(first_path_trace + other)
+
+            frames.append(dict(
                 data=frame_data,
+                traces=frame_traces,
                 name=f'{path_idx}_{i}'
             ))
 
+    # 프레임은 dict로 모아 두었다가 여기서 한 번만 검증한다 (go.Scattergl/go.Frame 생성 시 검증 생략)
     fig.frames = frames
 
     # 애니메이션 버튼
@@ -597,11 +934,11 @@ def plot_animated_path(paths: List[Dict], P1: float, V1: float,
         sliders=[{
             'currentvalue': {'prefix': '프레임: '},
             'steps': [
-                {'args': [[f.name], {'frame': {'duration': 0, 'redraw': True},
-                                      'mode': 'immediate'}],
-                 'label': f.name,
+                {'args': [[frame['name']], {'frame': {'duration': 0, 'redraw': True},
+                                            'mode': 'immediate'}],
+                 'label': frame['name'],
                  'method': 'animate'}
-                for f in frames
+                for frame in frames
             ]
         }] if frames else []
     )
@@ -741,31 +1078,20 @@ def plot_algorithm_comparison(comparison_results: Dict, dark_mode: bool = True)
     return fig
 
 
-def create_export_data(paths: List[Dict], optimal_path: Optional[Dict] = None) -> str:
-    """결과를 CSV 형식으로 내보내기"""
-    import io
+EXPORT_FIELDS = ('W', 'Q', 'dU', 'dH', 'dS', 'dG', 'efficiency')
 
-    output = io.StringIO()
-    output.write("경로,타입,일(W),열(Q),ΔU,ΔH,ΔS,ΔG,효율(%)\n")
 
-    for i, path in enumerate(paths):
-        output.write(f"경로 {i+1},{path.get('type', '일반')},")
-        output.write(f"{path.get('W', 0):.4f},")
-        output.write(f"{path.get('Q', 0):.4f},")
-        output.write(f"{path.get('dU', 0):.4f},")
-        output.write(f"{path.get('dH', 0):.4f},")
-        output.write(f"{path.get('dS', 0):.6f},")
-        output.write(f"{path.get('dG', 0):.4f},")
-        output.write(f"{path.get('efficiency', 0):.2f}\n")
+def _export_row(label: str, path: Dict, default_type: str) -> str:
+    """CSV 한 줄 (엔트로피는 소수점 6자리, 효율은 2자리)"""
+    W, Q, dU, dH, dS, dG, eff = (path.get(k, 0) for k in EXPORT_FIELDS)
+    return (f"{label},{path.get('type', default_type)},"
+            f"{W:.4f},{Q:.4f},{dU:.4f},{dH:.4f},{dS:.6f},{dG:.4f},{eff:.2f}")
 
+
+def create_export_data(paths: List[Dict], optimal_path: Optional[Dict] = None) -> str:
+    """결과를 CSV 형식으로 내보내기"""
+    rows = ["경로,타입,일(W),열(Q),ΔU,ΔH,ΔS,ΔG,효율(%)"]
+    rows.extend(_export_row(f"경로 {i+1}", path, '일반') for i, path in enumerate(paths))
     if optimal_path:
-        output.write(f"최적 경로,{optimal_path.get('type', '최적')},")
-        output.write(f"{optimal_path.get('W', 0):.4f},")
-        output.write(f"{optimal_path.get('Q', 0):.4f},")
-        output.write(f"{optimal_path.get('dU', 0):.4f},")
-        output.write(f"{optimal_path.get('dH', 0):.4f},")
-        output.write(f"{optimal_path.get('dS', 0):.6f},")
-        output.write(f"{optimal_path.get('dG', 0):.4f},")
-        output.write(f"{optimal_path.get('efficiency', 0):.2f}\n")
-
-    return output.getvalue()
+        rows.append(_export_row("최적 경로", optimal_path, '최적'))
+    return "\n".join(rows) + "\n"